@@ -2,7 +2,7 @@
 alembic/env.py — Alembic migration environment.
 
 Reads DATABASE_SYNC_URL from environment so the URL is never hard-coded.
-Imports all models via app.models so autogenerate can detect schema changes.
+Imports all models via app.models.registry so autogenerate can detect schema changes.
 """
 import os
 import sys
@@ -15,7 +15,7 @@ from sqlalchemy import engine_from_config, pool
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 # ── Import all models so Alembic autogenerate finds them ──────────────────────
-import app.models  # noqa: F401 — side-effect: registers all ORM models
+import app.models.registry  # noqa: F401 — side-effect: registers all ORM models
 from app.database import Base
 from app.config import get_settings
 
@@ -46,20 +46,35 @@ def run_migrations_offline() -> None:
 
 
 # ── Online migrations ─────────────────────────────────────────────────────────
+def _run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
+    # In-process callers (e.g. test fixtures) can hand over an already-open
+    # connection from their own pool:
+    #     cfg.attributes["connection"] = conn
+    #     command.upgrade(cfg, "head")
+    # which avoids a fresh connect + catalog warm-up per migration run.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_migrations(connection)
+        return
+
+    # Standalone CLI run — a single short-lived connection, no pool needed
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-        )
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_migrations(connection)
 
 
 if context.is_offline_mode():
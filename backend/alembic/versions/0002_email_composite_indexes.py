@@ -0,0 +1,32 @@
+"""Composite (mailbox_address, received_at DESC) index on emails.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Mailbox-scoped listings filter on mailbox_address and order by newest
+    # first; the composite also serves plain mailbox_address lookups, so the
+    # single-column index is redundant.
+    op.create_index(
+        "ix_emails_mailbox_received",
+        "emails",
+        ["mailbox_address", sa.text("received_at DESC")],
+    )
+    op.drop_index("ix_emails_mailbox_address", table_name="emails")
+
+
+def downgrade() -> None:
+    op.create_index("ix_emails_mailbox_address", "emails", ["mailbox_address"])
+    op.drop_index("ix_emails_mailbox_received", table_name="emails")
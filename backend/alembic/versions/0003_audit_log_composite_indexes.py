@@ -0,0 +1,40 @@
+"""Composite (analyst|action, timestamp DESC) indexes on audit_log.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The audit log page filters by analyst or action and sorts newest first.
+    # ix_audit_log_timestamp stays: the unfiltered list and CSV export scan
+    # purely by timestamp.
+    op.create_index(
+        "ix_audit_log_analyst_ts",
+        "audit_log",
+        ["analyst", sa.text("timestamp DESC")],
+    )
+    op.create_index(
+        "ix_audit_log_action_ts",
+        "audit_log",
+        ["action", sa.text("timestamp DESC")],
+    )
+    op.drop_index("ix_audit_log_analyst", table_name="audit_log")
+    op.drop_index("ix_audit_log_action", table_name="audit_log")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_log_action", "audit_log", ["action"])
+    op.create_index("ix_audit_log_analyst", "audit_log", ["analyst"])
+    op.drop_index("ix_audit_log_action_ts", table_name="audit_log")
+    op.drop_index("ix_audit_log_analyst_ts", table_name="audit_log")
@@ -0,0 +1,30 @@
+"""Partial index on emails.received_at for the pending review queue.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only the pending backlog is indexed, so the index stays small and hot
+    # no matter how many reviewed/overridden emails accumulate.
+    op.create_index(
+        "ix_emails_pending_queue",
+        "emails",
+        [sa.text("received_at DESC")],
+        postgresql_where=sa.text("review_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_emails_pending_queue", table_name="emails")
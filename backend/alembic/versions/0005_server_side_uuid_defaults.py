@@ -0,0 +1,28 @@
+"""Generate UUID primary keys server-side with gen_random_uuid().
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# gen_random_uuid() is built in from PostgreSQL 13 onwards.
+_TABLES = ("emails", "audit_log", "app_settings", "mailboxes", "custom_rules")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,25 @@
+"""Drop ix_mailboxes_address, which duplicates the address UNIQUE constraint.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # mailboxes_address_key (from the UNIQUE constraint) already indexes address.
+    # ix_emails_mailbox_address and ix_audit_log_analyst/_action were dropped
+    # alongside their composite replacements in 0002 and 0003.
+    op.drop_index("ix_mailboxes_address", table_name="mailboxes")
+
+
+def downgrade() -> None:
+    op.create_index("ix_mailboxes_address", "mailboxes", ["address"], unique=True)
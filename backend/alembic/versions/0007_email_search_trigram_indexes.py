@@ -0,0 +1,42 @@
+"""Trigram GIN indexes for ILIKE '%…%' search on emails.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("sender", "subject", "sender_domain")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY cannot run inside a transaction, but avoids locking out
+    # ingestion writes while the indexes build.
+    with op.get_context().autocommit_block():
+        for column in _COLUMNS:
+            op.create_index(
+                f"ix_emails_{column}_trgm",
+                "emails",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in _COLUMNS:
+            op.drop_index(
+                f"ix_emails_{column}_trgm",
+                table_name="emails",
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,55 @@
+"""Composite indexes for category/status-filtered, date-ordered email queries.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_emails_category_received",
+            "emails",
+            ["ai_category", sa.text("received_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_emails_status_received",
+            "emails",
+            ["review_status", sa.text("received_at DESC")],
+            postgresql_concurrently=True,
+        )
+        # Covers received_at range scans (dashboard/analytics trends) and the
+        # unfiltered newest-first list, so the single-column index can go.
+        op.create_index(
+            "ix_emails_received_category",
+            "emails",
+            ["received_at", "ai_category"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_emails_received_at", table_name="emails", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_emails_received_at", "emails", ["received_at"], postgresql_concurrently=True
+        )
+        for name in (
+            "ix_emails_received_category",
+            "ix_emails_status_received",
+            "ix_emails_category_received",
+        ):
+            op.drop_index(name, table_name="emails", postgresql_concurrently=True)
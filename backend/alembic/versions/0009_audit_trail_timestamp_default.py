@@ -0,0 +1,23 @@
+"""Default email_audit_trail.timestamp to now() on the server.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column("email_audit_trail", "timestamp", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    op.alter_column("email_audit_trail", "timestamp", server_default=None)
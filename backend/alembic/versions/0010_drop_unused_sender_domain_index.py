@@ -0,0 +1,33 @@
+"""Drop the unused btree index on emails.sender_domain.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No query filters sender_domain by equality or range: search goes through
+    # ix_emails_sender_domain_trgm and top-domains is a hash aggregate.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_emails_sender_domain", table_name="emails", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_emails_sender_domain",
+            "emails",
+            ["sender_domain"],
+            postgresql_concurrently=True,
+        )
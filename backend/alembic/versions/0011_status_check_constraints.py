@@ -0,0 +1,49 @@
+"""CHECK constraints on ai_category, review_status and job_status.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_CONSTRAINTS = (
+    (
+        "ck_emails_ai_category",
+        "emails",
+        "ai_category IN ('high_malicious', 'low_malicious', 'safe', 'pending')",
+    ),
+    (
+        "ck_emails_review_status",
+        "emails",
+        "review_status IN ('pending', 'reviewed', 'overridden')",
+    ),
+    (
+        "ck_app_settings_job_status",
+        "app_settings",
+        "job_status IN ('idle', 'running', 'paused', 'error')",
+    ),
+)
+
+
+def upgrade() -> None:
+    # NOT VALID + VALIDATE: ADD only takes the ACCESS EXCLUSIVE lock briefly.
+    for name, table, condition in _CONSTRAINTS:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+    # autocommit_block commits the ADDs first, so the scan of existing rows
+    # runs under VALIDATE's SHARE UPDATE EXCLUSIVE lock, which doesn't block
+    # ingestion writes.
+    with op.get_context().autocommit_block():
+        for name, table, _ in _CONSTRAINTS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_CONSTRAINTS):
+        op.drop_constraint(name, table, type_="check")
@@ -0,0 +1,45 @@
+"""Generated received_date column and (received_date, ai_category) index.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Adding a STORED generated column rewrites the table; run it in a
+    # maintenance window on large installs.
+    op.add_column(
+        "emails",
+        sa.Column(
+            "received_date",
+            sa.Date(),
+            sa.Computed("(received_at AT TIME ZONE 'UTC')::date", persisted=True),
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_emails_received_date_category",
+            "emails",
+            ["received_date", "ai_category"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_emails_received_date_category",
+            table_name="emails",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("emails", "received_date")
@@ -0,0 +1,26 @@
+"""No-op (was: generated reasoning_tsv full-text column on emails).
+
+The reasoning_tsv column, its GIN index and the emails_reasoning_text()
+helper were superseded by the keyword_hits table in 0014 before any release,
+so this revision no longer creates them — that only cost every upgrade a full
+rewrite of emails and an index build.  0014 still drops them if present, for
+databases that ran the original version of this revision.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
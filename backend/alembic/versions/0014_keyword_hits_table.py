@@ -0,0 +1,69 @@
+"""keyword_hits table for the analytics keyword chart; drop any emails.reasoning_tsv.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of app.services.analytics.PHISHING_KEYWORDS at this revision
+_KEYWORDS = (
+    "verify your account", "urgent action required",
+    "password expired", "wire transfer",
+    "confirm your identity", "unusual activity",
+    "click here immediately", "account suspended",
+    "invoice attached", "delivery failed",
+    "sign the document", "subscription renewal",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "keyword_hits",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "email_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("emails.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("keyword", sa.String(64), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.Column("ai_category", sa.String(32), nullable=False),
+    )
+
+    # Backfill with the same per-bullet substring match ingestion uses
+    values = ",".join(f"('{kw}')" for kw in _KEYWORDS)
+    op.execute(
+        f"""
+        INSERT INTO keyword_hits (email_id, keyword, hit_count, ai_category)
+        SELECT e.id, kw.keyword, COUNT(*), e.ai_category
+        FROM emails e,
+             unnest(e.ai_reasoning) AS reason,
+             (VALUES {values}) AS kw(keyword)
+        WHERE reason ILIKE '%' || kw.keyword || '%'
+        GROUP BY e.id, kw.keyword, e.ai_category
+        """
+    )
+    op.create_index("ix_keyword_hits_email_id", "keyword_hits", ["email_id"])
+    op.create_index(
+        "ix_keyword_hits_keyword_category", "keyword_hits", ["keyword", "ai_category"]
+    )
+
+    # Superseded by keyword_hits; only present where the original 0013 ran
+    op.execute("DROP INDEX IF EXISTS ix_emails_reasoning_tsv")
+    op.execute("ALTER TABLE emails DROP COLUMN IF EXISTS reasoning_tsv")
+    op.execute("DROP FUNCTION IF EXISTS emails_reasoning_text(text[])")
+
+
+def downgrade() -> None:
+    op.drop_table("keyword_hits")
@@ -0,0 +1,35 @@
+"""Partial (analyst, action) index on audit_log for analyst activity counts.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_log_analyst_action",
+            "audit_log",
+            ["analyst", "action"],
+            postgresql_where=sa.text("analyst <> 'system'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_log_analyst_action",
+            table_name="audit_log",
+            postgresql_concurrently=True,
+        )
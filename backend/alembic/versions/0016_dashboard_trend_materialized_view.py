@@ -0,0 +1,39 @@
+"""mv_dashboard_trend materialized view backing the dashboard summary.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_dashboard_trend AS
+        SELECT received_date AS date,
+               count(*) AS total,
+               count(*) FILTER (WHERE ai_category = 'high_malicious') AS high,
+               count(*) FILTER (WHERE ai_category = 'low_malicious') AS low,
+               count(*) FILTER (WHERE ai_category = 'safe') AS safe,
+               count(*) FILTER (WHERE review_status = 'pending') AS pending
+        FROM emails
+        WHERE received_date >= (now() AT TIME ZONE 'UTC')::date - 7
+        GROUP BY received_date
+        """
+    )
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_dashboard_trend_date ON mv_dashboard_trend (date)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_dashboard_trend")
@@ -1,6 +1,8 @@
 """
 app/database.py — Async SQLAlchemy engine, session factory, and base model.
 """
+from typing import Iterable, Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -11,13 +13,41 @@ settings = get_settings()
 # ── Async engine ───────────────────────────────────────────────────────────────
 engine = create_async_engine(
     settings.database_url,
-    echo=not settings.is_production,   # SQL logging in dev
+    echo=not settings.is_production,   # SQL logging in dev only
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_timeout=settings.db_pool_timeout,
+    # Compiled-SQL LRU cache, shared by every session on this engine (and the
+    # read-only variant below); the default of 500 is too small for the
+    # filter permutations of the list/analytics endpoints.
+    query_cache_size=2048,
+    connect_args={
+        "server_settings": {
+            # Short OLTP queries never benefit from JIT compilation
+            "jit": "off",
+            # Runaway queries must not hold a pooled connection indefinitely
+            "statement_timeout": str(settings.db_statement_timeout_ms),
+            "application_name": "phishdefender",
+        },
+        # Per-connection prepared statement cache (SQLAlchemy asyncpg adapter).
+        # Set to 0 when running behind PgBouncer in transaction pooling mode.
+        "prepared_statement_cache_size": 1024,
+    },
 )
 
-# ── Session factory ────────────────────────────────────────────────────────────
+# Every route awaits this engine directly; a sync DBAPI here would block the
+# event loop (and the asyncpg-only connect_args above would not apply).
+if engine.dialect.driver != "asyncpg":
+    raise RuntimeError(
+        f"DATABASE_URL must use the postgresql+asyncpg driver, got {engine.dialect.driver!r}"
+    )
+
+# Read-only variant sharing the same pool; AUTOCOMMIT skips BEGIN/COMMIT
+read_only_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+# ── Session factories ──────────────────────────────────────────────────────────
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -26,6 +56,14 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
+ReadOnlySessionLocal = async_sessionmaker(
+    bind=read_only_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
 
 # ── Base model ─────────────────────────────────────────────────────────────────
 class Base(DeclarativeBase):
@@ -48,3 +86,33 @@ async def get_db() -> AsyncSession:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_db_ro() -> AsyncSession:
+    """
+    Yields an autocommit session for read-only endpoints.
+    No transaction is opened, so there is nothing to commit or roll back.
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
+
+
+# ── Bulk loading ───────────────────────────────────────────────────────────────
+async def bulk_copy(
+    db: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[tuple],
+) -> None:
+    """
+    Load rows with asyncpg's binary COPY FROM STDIN inside the session's
+    current transaction.  Much faster than INSERT for large batches, but
+    SQLAlchemy-side defaults are not applied and there is no ON CONFLICT —
+    callers must supply every non-server-default column and pre-filter
+    duplicates.
+    """
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table, records=records, columns=list(columns)
+    )
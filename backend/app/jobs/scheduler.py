@@ -10,7 +10,9 @@ Job is skipped when:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -21,30 +23,65 @@ logger = logging.getLogger(__name__)
 
 _scheduler: AsyncIOScheduler | None = None
 
+# (fetched_at monotonic timestamp, job_status) — avoids a SELECT on every tick
+_JOB_STATUS_TTL = 10.0  # seconds
+_job_status_cache: tuple[float, str | None] | None = None
+
+# Strong refs to manually triggered runs (the loop only keeps weak ones)
+_manual_runs: set[asyncio.Task] = set()
+
+# Held by whichever run_ingestion() is in progress, scheduled or manual.
+# max_instances=1 only covers the scheduled job, and two overlapping runs
+# would race on graph_message_id (the COPY path has no ON CONFLICT).
+_ingestion_lock = asyncio.Lock()
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached job_status. Call after any AppSettings.job_status change."""
+    global _job_status_cache
+    _job_status_cache = None
+
+
+async def _get_job_status() -> str | None:
+    """Return AppSettings.job_status, re-reading the DB at most every _JOB_STATUS_TTL seconds."""
+    global _job_status_cache
+    now = time.monotonic()
+    if _job_status_cache is not None and now - _job_status_cache[0] < _JOB_STATUS_TTL:
+        return _job_status_cache[1]
 
-async def _ingestion_job() -> None:
-    """Wrapper called by APScheduler — guards against paused state."""
     from app.database import AsyncSessionLocal  # deferred import
     from app.models.settings import AppSettings
     from sqlalchemy import select
 
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(AppSettings.job_status).limit(1))
+        status = result.scalar_one_or_none()
+
+    _job_status_cache = (now, status)
+    return status
+
+
+async def _ingestion_job() -> None:
+    """Wrapper called by APScheduler — guards against paused state."""
     settings_cfg = get_settings()
 
     if not settings_cfg.graph_api_configured:
         logger.debug("Ingestion job skipped — Graph API not configured")
         return
 
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(select(AppSettings).limit(1))
-        row = result.scalar_one_or_none()
-        if row and row.job_status == "paused":
-            logger.debug("Ingestion job skipped — status is paused")
-            return
+    if await _get_job_status() == "paused":
+        logger.debug("Ingestion job skipped — status is paused")
+        return
+
+    if _ingestion_lock.locked():
+        logger.debug("Ingestion job skipped — a manual run is in progress")
+        return
 
     from app.services.ingestion import run_ingestion  # deferred import
 
     try:
-        summary = await run_ingestion()
+        async with _ingestion_lock:
+            summary = await run_ingestion()
         logger.info(
             "Scheduled ingestion complete: %d emails ingested from %d mailboxes",
             summary.get("total_ingested", 0),
@@ -54,17 +91,62 @@ async def _ingestion_job() -> None:
         logger.error("Scheduled ingestion failed: %s", exc, exc_info=True)
 
 
+def trigger_ingestion() -> bool:
+    """
+    Start run_ingestion() as a task on the running event loop, detached from
+    the calling request.  Returns False if an ingestion run (manual or
+    scheduled) is already in flight.
+    """
+    if _manual_runs or _ingestion_lock.locked():
+        return False
+
+    task = asyncio.create_task(_manual_ingestion(), name="manual-ingestion")
+    _manual_runs.add(task)
+    task.add_done_callback(_on_manual_run_done)
+    return True
+
+
+async def _manual_ingestion() -> None:
+    from app.services.ingestion import run_ingestion  # deferred import
+
+    async with _ingestion_lock:
+        await run_ingestion()
+
+
+def _on_manual_run_done(task: asyncio.Task) -> None:
+    _manual_runs.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Manual ingestion failed: %s", task.exception(), exc_info=task.exception())
+
+
+async def _refresh_dashboard_job() -> None:
+    """Refresh the dashboard's materialized per-day counts."""
+    from app.database import engine  # deferred import
+    from app.models.dashboard_view import VIEW_NAME
+    from sqlalchemy import text
+
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {VIEW_NAME}"))
+    except Exception as exc:
+        logger.error("Dashboard view refresh failed: %s", exc, exc_info=True)
+
+
 def get_scheduler() -> AsyncIOScheduler:
     """Return the module-level scheduler instance (created on first call)."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = AsyncIOScheduler(timezone="UTC")
+        _scheduler = AsyncIOScheduler(
+            timezone="UTC",
+            # Never run overlapping copies of a job; collapse missed runs into one
+            job_defaults={"coalesce": True, "max_instances": 1},
+        )
     return _scheduler
 
 
 def start_scheduler() -> None:
     """
-    Register the ingestion job and start the scheduler.
+    Register the ingestion and dashboard refresh jobs and start the scheduler.
     Called once during the FastAPI lifespan startup.
     """
     settings = get_settings()
@@ -78,6 +160,13 @@ def start_scheduler() -> None:
         replace_existing=True,
         misfire_grace_time=60,
     )
+    scheduler.add_job(
+        _refresh_dashboard_job,
+        trigger=IntervalTrigger(seconds=60),
+        id="dashboard_refresh",
+        name="Dashboard materialized view refresh",
+        replace_existing=True,
+    )
 
     scheduler.start()
     logger.info(
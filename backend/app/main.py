@@ -2,7 +2,9 @@
 app/main.py — FastAPI application factory.
 
 Startup sequence:
-  1. Create all DB tables if they don't exist (via Alembic-compatible Base.metadata).
+  1. Development: create all DB tables if they don't exist (Base.metadata).
+     Production: schema is owned by `alembic upgrade head`; only verify that
+     the database is at the latest revision.
   2. Seed the AppSettings singleton row and any mailboxes from .env.
   3. Start the APScheduler background ingestion job.
 
@@ -13,10 +15,15 @@ from __future__ import annotations
 
 import logging
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from sqlalchemy import text
 
 from app.config import get_settings
 from app.database import AsyncSessionLocal, Base, engine
@@ -26,6 +33,11 @@ from app.routers import analytics, audit_log, dashboard, emails, settings
 logger = logging.getLogger(__name__)
 settings_cfg = get_settings()
 
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Health probes hit this several times a second — serialise once
+_HEALTH_BODY = orjson.dumps({"status": "ok", "version": "1.0.0"})
+
 
 # ── Startup / shutdown lifespan ────────────────────────────────────────────────
 
@@ -34,39 +46,84 @@ async def _seed_db() -> None:
     Ensure the singleton AppSettings row exists and all mailboxes from .env
     are present in the database.
     """
-    from sqlalchemy import select
+    from sqlalchemy import literal, select
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
 
     from app.models.mailbox import Mailbox
     from app.models.settings import AppSettings
 
     async with AsyncSessionLocal() as db:
         # AppSettings singleton
-        result = await db.execute(select(AppSettings).limit(1))
-        if result.scalar_one_or_none() is None:
+        exists = await db.scalar(select(literal(1)).select_from(AppSettings).limit(1))
+        if exists is None:
             db.add(AppSettings())
             logger.info("Created default AppSettings row")
 
-        # Mailboxes from SHARED_MAILBOXES env var
-        for address in settings_cfg.mailbox_list:
-            mb_result = await db.execute(
-                select(Mailbox).where(Mailbox.address == address)
+        # Mailboxes from SHARED_MAILBOXES env var — one bulk upsert, existing
+        # addresses are left untouched.
+        rows = [
+            {
+                "address": address,
+                "display_name": address.split("@")[0].replace("-", " ").replace("_", " ").title(),
+            }
+            for address in settings_cfg.mailbox_list
+        ]
+        if rows:
+            result = await db.execute(
+                pg_insert(Mailbox)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["address"])
+                .returning(Mailbox.address)
             )
-            if mb_result.scalar_one_or_none() is None:
-                display = address.split("@")[0].replace("-", " ").replace("_", " ").title()
-                db.add(Mailbox(address=address, display_name=display))
+            for address in result.scalars():
                 logger.info("Seeded mailbox: %s", address)
 
         await db.commit()
 
 
+async def _check_migrations() -> None:
+    """
+    Warn when the database is not at the latest Alembic revision.
+    Issues a single SELECT — never DDL — so production boot stays cheap.
+    """
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    cfg = Config(str(_BACKEND_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    head = ScriptDirectory.from_config(cfg).get_current_head()
+
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = result.scalar_one_or_none()
+    except Exception as exc:
+        logger.warning("Could not read alembic_version (%s) — run `alembic upgrade head`", exc)
+        return
+
+    if current != head:
+        logger.warning(
+            "Database schema is at revision %s but latest is %s — run `alembic upgrade head`",
+            current,
+            head,
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # ── Startup ────────────────────────────────────────────────────────────
     logger.info("PhishDefender backend starting up…")
 
-    # Create tables (idempotent — does not drop existing data)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if settings_cfg.is_production:
+        # Schema is managed by `alembic upgrade head` (run before the app starts)
+        await _check_migrations()
+    else:
+        # Create tables (idempotent — does not drop existing data)
+        from app.models import registry  # noqa: F401 — make Base.metadata complete
+
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.create_all)
 
     await _seed_db()
     start_scheduler()
@@ -95,6 +152,7 @@ def create_app() -> FastAPI:
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # ── CORS ───────────────────────────────────────────────────────────────
@@ -115,8 +173,21 @@ def create_app() -> FastAPI:
 
     # ── Health check ───────────────────────────────────────────────────────
     @app.get("/api/health", tags=["health"])
-    async def health() -> dict:
-        return {"status": "ok", "version": "1.0.0"}
+    async def health() -> Response:
+        return Response(content=_HEALTH_BODY, media_type="application/json")
+
+    # Pool internals are diagnostics only; the API has no auth layer, so this
+    # route is not registered in production.
+    if not settings_cfg.is_production:
+
+        @app.get("/api/health/pool", tags=["health"])
+        async def health_pool() -> dict:
+            pool = engine.pool
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
 
     return app
 
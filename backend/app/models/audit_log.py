@@ -1,10 +1,9 @@
 """
 app/models/audit_log.py — Global analyst action log (reviewed / override / export).
 """
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -18,16 +17,18 @@ class AuditLog(Base):
     """
     __tablename__ = "audit_log"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     timestamp = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
     )
 
     # Who performed the action
-    analyst = Column(String(256), nullable=False, index=True)
+    analyst = Column(String(256), nullable=False)
 
     # Action type: "reviewed" | "override" | "export" | "settings_change" | "job_trigger"
-    action = Column(String(64), nullable=False, index=True)
+    action = Column(String(64), nullable=False)
 
     # Optional link to the email this action concerns
     email_id = Column(
@@ -43,3 +44,16 @@ class AuditLog(Base):
     # Previous and new values for override actions
     previous_category = Column(String(32), nullable=True)
     new_category = Column(String(32), nullable=True)
+
+    __table_args__ = (
+        # Filtered audit log views, newest first
+        Index("ix_audit_log_analyst_ts", analyst, timestamp.desc()),
+        Index("ix_audit_log_action_ts", action, timestamp.desc()),
+        # Per-analyst activity aggregate (index-only scan; system rows excluded)
+        Index(
+            "ix_audit_log_analyst_action",
+            analyst,
+            action,
+            postgresql_where=text("analyst <> 'system'"),
+        ),
+    )
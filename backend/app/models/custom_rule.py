@@ -1,10 +1,9 @@
 """
 app/models/custom_rule.py — Analyst-defined force-classification rules.
 """
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, String, func
+from sqlalchemy import Boolean, Column, DateTime, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database import Base
@@ -26,7 +25,9 @@ class CustomRule(Base):
     """
     __tablename__ = "custom_rules"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # "domain" | "keyword"
     rule_type = Column(String(16), nullable=False, index=True)
@@ -0,0 +1,48 @@
+"""
+app/models/dashboard_view.py — Materialized per-day email counts for the dashboard.
+
+mv_dashboard_trend is created by migration 0016 (or by create_all in dev via the
+after_create hook below) and refreshed every minute by the scheduler.  It lives
+in its own MetaData so create_all / autogenerate never treat it as a table.
+"""
+from sqlalchemy import DDL, BigInteger, Column, Date, MetaData, Table, event
+
+from app.database import Base
+
+VIEW_NAME = "mv_dashboard_trend"
+
+# Last 8 UTC days (today + the 7 before it), one row per day with emails
+VIEW_QUERY = """
+SELECT received_date AS date,
+       count(*) AS total,
+       count(*) FILTER (WHERE ai_category = 'high_malicious') AS high,
+       count(*) FILTER (WHERE ai_category = 'low_malicious') AS low,
+       count(*) FILTER (WHERE ai_category = 'safe') AS safe,
+       count(*) FILTER (WHERE review_status = 'pending') AS pending
+FROM emails
+WHERE received_date >= (now() AT TIME ZONE 'UTC')::date - 7
+GROUP BY received_date
+"""
+
+dashboard_trend = Table(
+    VIEW_NAME,
+    MetaData(),
+    Column("date", Date, primary_key=True),
+    Column("total", BigInteger, nullable=False),
+    Column("high", BigInteger, nullable=False),
+    Column("low", BigInteger, nullable=False),
+    Column("safe", BigInteger, nullable=False),
+    Column("pending", BigInteger, nullable=False),
+)
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {VIEW_NAME} AS {VIEW_QUERY}"),
+)
+# REFRESH ... CONCURRENTLY requires a unique index on the view
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{VIEW_NAME}_date ON {VIEW_NAME} (date)"),
+)
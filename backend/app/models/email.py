@@ -1,22 +1,26 @@
 """
-app/models/email.py — Email, per-email threat indicators, and per-email audit trail.
+app/models/email.py — Email, per-email threat indicators, keyword hits, and audit trail.
 """
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
+    Computed,
+    Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
 
@@ -28,22 +32,29 @@ class Email(Base):
     """
     __tablename__ = "emails"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # Graph API identifiers
     graph_message_id = Column(String(512), unique=True, nullable=True, index=True)
-    mailbox_address = Column(String(256), nullable=False, index=True)
+    mailbox_address = Column(String(256), nullable=False)
 
     # Envelope fields
     sender = Column(String(512), nullable=False)
-    sender_domain = Column(String(256), nullable=False, index=True)
+    sender_domain = Column(String(256), nullable=False)
     recipient = Column(String(512), nullable=False)
     subject = Column(Text, nullable=False)
-    received_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    received_at = Column(DateTime(timezone=True), nullable=False)
+    # UTC calendar day of received_at, kept by Postgres for per-day trend buckets
+    received_date = Column(
+        Date, Computed("(received_at AT TIME ZONE 'UTC')::date", persisted=True)
+    )
 
-    # Email body (HTML preserved for sandbox rendering)
-    body_html = Column(Text, nullable=True)
-    body_text = Column(Text, nullable=True)
+    # Email body (HTML preserved for sandbox rendering).
+    # Deferred: only the detail view needs them — use undefer() there.
+    body_html = deferred(Column(Text, nullable=True))
+    body_text = deferred(Column(Text, nullable=True))
 
     # AI classification
     ai_category = Column(String(32), nullable=False, default="pending")
@@ -73,15 +84,70 @@ class Email(Base):
         nullable=False,
     )
 
-    # Relationships
+    # Relationships — lazy="raise": implicit lazy loads are IO under asyncio
+    # and would hide N+1 queries; load them explicitly with selectinload().
+    # passive_deletes: the FKs are ON DELETE CASCADE, so deleting an Email
+    # never needs to load its children first.
     threat_indicators = relationship(
-        "ThreatIndicator", back_populates="email", cascade="all, delete-orphan"
+        "ThreatIndicator",
+        back_populates="email",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     audit_trail = relationship(
         "AuditTrailEntry",
         back_populates="email",
         cascade="all, delete-orphan",
         order_by="AuditTrailEntry.timestamp",
+        passive_deletes=True,
+        lazy="raise",
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "ai_category IN ('high_malicious', 'low_malicious', 'safe', 'pending')",
+            name="ck_emails_ai_category",
+        ),
+        CheckConstraint(
+            "review_status IN ('pending', 'reviewed', 'overridden')",
+            name="ck_emails_review_status",
+        ),
+        # Mailbox-scoped listings, newest first
+        Index("ix_emails_mailbox_received", mailbox_address, received_at.desc()),
+        # Category / review-status filtered lists, newest first
+        Index("ix_emails_category_received", ai_category, received_at.desc()),
+        Index("ix_emails_status_received", review_status, received_at.desc()),
+        # Date-range trends and the unfiltered list
+        Index("ix_emails_received_category", received_at, ai_category),
+        # Per-day category trend (analytics)
+        Index("ix_emails_received_date_category", received_date, ai_category),
+        # Pending review queue only — terminal-state rows are never indexed
+        Index(
+            "ix_emails_pending_queue",
+            received_at.desc(),
+            postgresql_where=text("review_status = 'pending'"),
+        ),
+        # Trigram indexes so the list search's ILIKE '%…%' can use an index
+        # (requires the pg_trgm extension)
+        Index(
+            "ix_emails_sender_trgm",
+            sender,
+            postgresql_using="gin",
+            postgresql_ops={"sender": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_emails_subject_trgm",
+            subject,
+            postgresql_using="gin",
+            postgresql_ops={"subject": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_emails_sender_domain_trgm",
+            sender_domain,
+            postgresql_using="gin",
+            postgresql_ops={"sender_domain": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -107,6 +173,31 @@ class ThreatIndicator(Base):
     email = relationship("Email", back_populates="threat_indicators")
 
 
+class KeywordHit(Base):
+    """
+    Phishing-keyword mentions in an email's AI reasoning, written at ingestion
+    so the analytics keyword chart is a plain aggregate over this table.
+    """
+    __tablename__ = "keyword_hits"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    email_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("emails.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    keyword = Column(String(64), nullable=False)
+    # Number of reasoning bullets mentioning the keyword
+    hit_count = Column(Integer, nullable=False, default=1)
+    # Copy of Email.ai_category (set once by the classifier, never overridden)
+    ai_category = Column(String(32), nullable=False)
+
+    __table_args__ = (
+        Index("ix_keyword_hits_keyword_category", keyword, ai_category),
+    )
+
+
 class AuditTrailEntry(Base):
     """
     Per-email audit trail entry (inline timeline shown in EmailDetail).
@@ -121,7 +212,9 @@ class AuditTrailEntry(Base):
         nullable=False,
         index=True,
     )
-    timestamp = Column(DateTime(timezone=True), nullable=False)
+    timestamp = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     action = Column(String(64), nullable=False)
     actor = Column(String(256), nullable=False)
     detail = Column(Text, nullable=True)
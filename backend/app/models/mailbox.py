@@ -1,10 +1,9 @@
 """
 app/models/mailbox.py — Connected shared mailbox configuration.
 """
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, String, func
+from sqlalchemy import Boolean, Column, DateTime, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database import Base
@@ -17,10 +16,12 @@ class Mailbox(Base):
     """
     __tablename__ = "mailboxes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # The mailbox UPN / email address used in Graph API calls
-    address = Column(String(256), unique=True, nullable=False, index=True)
+    address = Column(String(256), unique=True, nullable=False)
 
     # Display name shown in the Settings UI
     display_name = Column(String(256), nullable=False)
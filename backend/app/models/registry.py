@@ -0,0 +1,7 @@
+"""app/models/registry.py — Import every model so Base.metadata is complete (Alembic, create_all)."""
+from app.models.email import Email, ThreatIndicator, KeywordHit, AuditTrailEntry  # noqa: F401
+from app.models.audit_log import AuditLog  # noqa: F401
+from app.models.settings import AppSettings  # noqa: F401
+from app.models.mailbox import Mailbox  # noqa: F401
+from app.models.custom_rule import CustomRule  # noqa: F401
+from app.models import dashboard_view  # noqa: F401 — registers the view DDL
@@ -1,10 +1,19 @@
 """
 app/models/settings.py — Singleton application settings row.
 """
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, func
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database import Base
@@ -17,7 +26,9 @@ class AppSettings(Base):
     """
     __tablename__ = "app_settings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # Ingestion job
     job_status = Column(String(16), nullable=False, default="idle")
@@ -40,3 +51,10 @@ class AppSettings(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (
+        CheckConstraint(
+            "job_status IN ('idle', 'running', 'paused', 'error')",
+            name="ck_app_settings_job_status",
+        ),
+    )
@@ -8,20 +8,26 @@ from __future__ import annotations
 
 import csv
 import io
-import math
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db_ro
 from app.models.audit_log import AuditLog
 from app.schemas.audit_log import AuditLogEntry, AuditLogResponse
 
 router = APIRouter(prefix="/api/audit-log", tags=["audit-log"])
 
+_EXPORT_CHUNK_SIZE = 1000
+_EXPORT_STATEMENT_TIMEOUT = "300s"
+_EXPORT_FIELDS = (
+    "id", "timestamp", "analyst", "action",
+    "email_id", "detail", "previous_category", "new_category",
+)
+
 
 @router.get("", response_model=AuditLogResponse)
 async def list_audit_log(
@@ -29,7 +35,7 @@ async def list_audit_log(
     action: Optional[str] = Query(None, description="Filter by action type"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> AuditLogResponse:
     base = select(AuditLog)
     count_base = select(func.count(AuditLog.id))
@@ -55,7 +61,7 @@ async def list_audit_log(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=max(1, math.ceil(total / page_size)),
+        total_pages=(total + page_size - 1) // page_size or 1,
     )
 
 
@@ -63,43 +69,49 @@ async def list_audit_log(
 async def export_audit_log(
     analyst: Optional[str] = Query(None),
     action: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
 ) -> StreamingResponse:
-    query = select(AuditLog).order_by(AuditLog.timestamp.desc())
+    query = (
+        select(AuditLog)
+        .order_by(AuditLog.timestamp.desc())
+        .execution_options(yield_per=_EXPORT_CHUNK_SIZE)
+    )
     if analyst:
         query = query.where(AuditLog.analyst.ilike(f"%{analyst}%"))
     if action:
         query = query.where(AuditLog.action == action)
 
-    result = await db.execute(query)
-    entries = result.scalars().all()
+    async def generate() -> AsyncIterator[str]:
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(_EXPORT_FIELDS)
+        yield output.getvalue()
+
+        # Own session: the request-scoped one is closed before streaming starts,
+        # and a server-side cursor needs a (non-autocommit) transaction.
+        async with AsyncSessionLocal() as db:
+            # Full exports legitimately outlive the default statement_timeout
+            await db.execute(text(f"SET LOCAL statement_timeout = '{_EXPORT_STATEMENT_TIMEOUT}'"))
+            result = await db.stream(query)
+            async for partition in result.scalars().partitions():
+                output.seek(0)
+                output.truncate()
+                for e in partition:
+                    writer.writerow(
+                        (
+                            str(e.id),
+                            e.timestamp.isoformat(),
+                            e.analyst,
+                            e.action,
+                            str(e.email_id) if e.email_id else "",
+                            e.detail or "",
+                            e.previous_category or "",
+                            e.new_category or "",
+                        )
+                    )
+                yield output.getvalue()
 
-    output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=[
-            "id", "timestamp", "analyst", "action",
-            "email_id", "detail", "previous_category", "new_category",
-        ],
-    )
-    writer.writeheader()
-    for e in entries:
-        writer.writerow(
-            {
-                "id": str(e.id),
-                "timestamp": e.timestamp.isoformat(),
-                "analyst": e.analyst,
-                "action": e.action,
-                "email_id": str(e.email_id) if e.email_id else "",
-                "detail": e.detail or "",
-                "previous_category": e.previous_category or "",
-                "new_category": e.new_category or "",
-            }
-        )
-
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=phishdefender_audit_log.csv"
@@ -5,13 +5,15 @@ GET /api/dashboard/summary
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import case, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db_ro
+from app.models.dashboard_view import dashboard_trend
 from app.models.email import Email
 from app.models.mailbox import Mailbox
 from app.models.settings import AppSettings
@@ -21,61 +23,70 @@ from app.schemas.email import EmailListItem
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 
-@router.get("/summary", response_model=DashboardSummary)
-async def get_summary(db: AsyncSession = Depends(get_db)) -> DashboardSummary:
-    today_start = datetime.now(timezone.utc).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
+_EMPTY_TODAY = {"total": 0, "high": 0, "low": 0, "safe": 0, "pending": 0}
 
-    # ── Today's counts ────────────────────────────────────────────────────
-    today_result = await db.execute(
-        select(
-            func.count(Email.id).label("total"),
-            func.count(case((Email.ai_category == "high_malicious", 1))).label("high"),
-            func.count(case((Email.ai_category == "low_malicious", 1))).label("low"),
-            func.count(case((Email.ai_category == "safe", 1))).label("safe"),
-            func.count(case((Email.review_status == "pending", 1))).label("pending"),
-        ).where(Email.received_at >= today_start)
-    )
-    counts = today_result.one()
 
-    # ── 7-day trend ───────────────────────────────────────────────────────
+async def _get_trend_and_today(
+    db: AsyncSession,
+) -> Tuple[List[TrendDay], Dict[str, int]]:
+    """Return (7-day trend, today's counts) from mv_dashboard_trend."""
+    # The view is refreshed every minute by the scheduler, so this reads a
+    # handful of precomputed rows instead of aggregating emails per request.
+    today = datetime.now(timezone.utc).date()
     trend_rows = await db.execute(
-        select(
-            func.date(Email.received_at).label("date"),
-            func.count(case((Email.ai_category == "high_malicious", 1))).label("high"),
-            func.count(case((Email.ai_category == "low_malicious", 1))).label("low"),
-            func.count(case((Email.ai_category == "safe", 1))).label("safe"),
-        )
-        .where(Email.received_at >= seven_days_ago)
-        .group_by(func.date(Email.received_at))
-        .order_by(func.date(Email.received_at))
+        select(dashboard_trend).order_by(dashboard_trend.c.date)
     )
-    trend = [
-        TrendDay(
-            date=str(r.date),
-            high_malicious=r.high,
-            low_malicious=r.low,
-            safe=r.safe,
+    trend: List[TrendDay] = []
+    counts = _EMPTY_TODAY
+    for r in trend_rows:
+        trend.append(
+            TrendDay(
+                date=str(r.date),
+                high_malicious=r.high,
+                low_malicious=r.low,
+                safe=r.safe,
+            )
         )
-        for r in trend_rows
-    ]
+        if r.date == today:
+            counts = {
+                "total": r.total,
+                "high": r.high,
+                "low": r.low,
+                "safe": r.safe,
+                "pending": r.pending,
+            }
+    return trend, counts
+
+
+@router.get("/summary", response_model=DashboardSummary)
+async def get_summary(db: AsyncSession = Depends(get_db_ro)) -> DashboardSummary:
+    trend, counts = await _get_trend_and_today(db)
 
     # ── Ingestion status ──────────────────────────────────────────────────
-    settings_result = await db.execute(select(AppSettings).limit(1))
-    settings_row = settings_result.scalar_one_or_none()
+    settings_result = await db.execute(
+        select(
+            AppSettings.job_status,
+            AppSettings.job_last_run,
+            AppSettings.job_error_message,
+        ).limit(1)
+    )
+    settings_row = settings_result.one_or_none()
 
-    mb_result = await db.execute(select(Mailbox))
-    mailboxes = list(mb_result.scalars().all())
-    active_mb = sum(1 for m in mailboxes if m.is_active)
+    mb_counts = (
+        await db.execute(
+            select(
+                func.count().filter(Mailbox.is_active.is_(True)).label("active"),
+                func.count().label("total"),
+            ).select_from(Mailbox)
+        )
+    ).one()
 
     ingestion = IngestionStatus(
         status=settings_row.job_status if settings_row else "idle",
         last_run=settings_row.job_last_run if settings_row else None,
         error_message=settings_row.job_error_message if settings_row else None,
-        mailboxes_active=active_mb,
-        mailboxes_total=len(mailboxes),
+        mailboxes_active=mb_counts.active,
+        mailboxes_total=mb_counts.total,
     )
 
     # ── Recent high malicious ─────────────────────────────────────────────
@@ -88,11 +99,11 @@ async def get_summary(db: AsyncSession = Depends(get_db)) -> DashboardSummary:
     recent = [EmailListItem.model_validate(e) for e in recent_result.scalars().all()]
 
     return DashboardSummary(
-        total_today=counts.total,
-        high_malicious_today=counts.high,
-        low_malicious_today=counts.low,
-        safe_today=counts.safe,
-        pending_review=counts.pending,
+        total_today=counts["total"],
+        high_malicious_today=counts["high"],
+        low_malicious_today=counts["low"],
+        safe_today=counts["safe"],
+        pending_review=counts["pending"],
         trend=trend,
         ingestion=ingestion,
         recent_high_malicious=recent,
@@ -13,15 +13,15 @@ import csv
 import io
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import or_, select
+from sqlalchemy import func, insert, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db, get_db_ro
 from app.models.audit_log import AuditLog
 from app.models.email import AuditTrailEntry, Email
 from app.schemas.email import (
@@ -31,6 +31,7 @@ from app.schemas.email import (
     EmailListResponse,
     OverrideRequest,
 )
+from app.services.emails import build_email_detail
 
 router = APIRouter(prefix="/api/emails", tags=["emails"])
 
@@ -44,17 +45,16 @@ async def list_emails(
     search: Optional[str] = Query(None, description="Search sender/subject"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> EmailListResponse:
-    query = select(Email)
-
+    conditions = []
     if category:
-        query = query.where(Email.ai_category == category)
+        conditions.append(Email.ai_category == category)
     if status:
-        query = query.where(Email.review_status == status)
+        conditions.append(Email.review_status == status)
     if search:
         pattern = f"%{search}%"
-        query = query.where(
+        conditions.append(
             or_(
                 Email.sender.ilike(pattern),
                 Email.subject.ilike(pattern),
@@ -62,48 +62,31 @@ async def list_emails(
             )
         )
 
-    # Count total
-    count_result = await db.execute(
-        select(Email.id).where(
-            *([query.whereclause] if query.whereclause is not None else [])
-        )
-    )
-    # Simpler total count approach
-    from sqlalchemy import func
-    count_query = select(func.count(Email.id))
-    if category:
-        count_query = count_query.where(Email.ai_category == category)
-    if status:
-        count_query = count_query.where(Email.review_status == status)
-    if search:
-        pattern = f"%{search}%"
-        count_query = count_query.where(
-            or_(
-                Email.sender.ilike(pattern),
-                Email.subject.ilike(pattern),
-                Email.sender_domain.ilike(pattern),
-            )
+    # Paginated fetch — total comes back on every row via COUNT(*) OVER ()
+    offset = (page - 1) * page_size
+    rows = (
+        await db.execute(
+            select(Email, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(Email.received_at.desc())
+            .offset(offset)
+            .limit(page_size)
         )
-    total_result = await db.execute(count_query)
-    total: int = total_result.scalar_one()
+    ).all()
+    emails = [r.Email for r in rows]
 
-    # Paginated fetch
-    offset = (page - 1) * page_size
-    query = (
-        query.order_by(Email.received_at.desc())
-        .offset(offset)
-        .limit(page_size)
-    )
-    emails_result = await db.execute(query)
-    emails = emails_result.scalars().all()
+    if rows:
+        total: int = rows[0].total
+    else:
+        # Past the last page (or no matches) — the window count is unavailable
+        total = await db.scalar(select(func.count(Email.id)).where(*conditions))
 
-    import math
     return EmailListResponse(
         emails=[EmailListItem.model_validate(e) for e in emails],
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=max(1, math.ceil(total / page_size)),
+        total_pages=(total + page_size - 1) // page_size or 1,
     )
 
 
@@ -112,11 +95,13 @@ async def list_emails(
 @router.get("/{email_id}", response_model=EmailDetail)
 async def get_email(
     email_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> EmailDetail:
     result = await db.execute(
         select(Email)
         .options(
+            undefer(Email.body_html),
+            undefer(Email.body_text),
             selectinload(Email.threat_indicators),
             selectinload(Email.audit_trail),
         )
@@ -125,7 +110,7 @@ async def get_email(
     email = result.scalar_one_or_none()
     if not email:
         raise HTTPException(status_code=404, detail="Email not found")
-    return EmailDetail.model_validate(email)
+    return await build_email_detail(db, email)
 
 
 # ── Analyst override ───────────────────────────────────────────────────────────
@@ -139,6 +124,8 @@ async def override_email(
     result = await db.execute(
         select(Email)
         .options(
+            undefer(Email.body_html),
+            undefer(Email.body_text),
             selectinload(Email.threat_indicators),
             selectinload(Email.audit_trail),
         )
@@ -149,20 +136,21 @@ async def override_email(
         raise HTTPException(status_code=404, detail="Email not found")
 
     previous_category = email.ai_category
+    now = datetime.now(timezone.utc)
 
     # Update the email record
     email.analyst_category = body.new_category
     email.analyst_override_reason = body.reason
     email.reviewed_by = body.analyst
-    email.reviewed_at = datetime.now(timezone.utc)
+    email.reviewed_at = now
     email.review_status = "overridden"
-    db.add(email)
+    # Set explicitly (instead of the onupdate default) so the response can be
+    # built from memory without re-fetching the row
+    email.updated_at = now
 
-    # Append to per-email audit trail
-    db.add(
+    # Append to per-email audit trail (already loaded — no refresh needed)
+    email.audit_trail.append(
         AuditTrailEntry(
-            email_id=email.id,
-            timestamp=datetime.now(timezone.utc),
             action="override",
             actor=body.analyst,
             detail=f"Reclassified {previous_category} → {body.new_category}. Reason: {body.reason}",
@@ -181,9 +169,8 @@ async def override_email(
         )
     )
 
-    await db.flush()
-    await db.refresh(email)
-    return EmailDetail.model_validate(email)
+    await db.flush()  # assigns the trail entry's id and timestamp
+    return await build_email_detail(db, email)
 
 
 # ── Bulk review ────────────────────────────────────────────────────────────────
@@ -193,103 +180,118 @@ async def bulk_review(
     body: BulkReviewRequest,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
+    now = datetime.now(timezone.utc)
     result = await db.execute(
-        select(Email).where(Email.id.in_(body.email_ids))
+        update(Email)
+        .where(Email.id.in_(body.email_ids), Email.review_status == "pending")
+        .values(review_status="reviewed", reviewed_by=body.analyst, reviewed_at=now)
+        .returning(Email.id)
+        .execution_options(synchronize_session=False)
     )
-    emails = list(result.scalars().all())
-    now = datetime.now(timezone.utc)
+    updated_ids = list(result.scalars().all())
+
+    trail_rows = [
+        {
+            "email_id": email_id,
+            "action": "reviewed",
+            "actor": body.analyst,
+            "detail": "Marked as reviewed (bulk action)",
+        }
+        for email_id in updated_ids
+    ]
+    log_rows = [
+        {
+            "analyst": body.analyst,
+            "action": "reviewed",
+            "email_id": email_id,
+            "detail": "Bulk review",
+        }
+        for email_id in updated_ids
+    ]
+
+    if updated_ids:
+        await db.execute(insert(AuditTrailEntry), trail_rows)
+        await db.execute(insert(AuditLog), log_rows)
+
+    return {"updated": len(updated_ids)}
 
-    updated = 0
-    for email in emails:
-        if email.review_status == "pending":
-            email.review_status = "reviewed"
-            email.reviewed_by = body.analyst
-            email.reviewed_at = now
-            db.add(email)
-
-            db.add(
-                AuditTrailEntry(
-                    email_id=email.id,
-                    timestamp=now,
-                    action="reviewed",
-                    actor=body.analyst,
-                    detail="Marked as reviewed (bulk action)",
-                )
-            )
-            db.add(
-                AuditLog(
-                    analyst=body.analyst,
-                    action="reviewed",
-                    email_id=email.id,
-                    detail="Bulk review",
-                )
-            )
-            updated += 1
 
-    return {"updated": updated}
+# ── CSV export ─────────────────────────────────────────────────────────────────
 
+_EXPORT_CHUNK_SIZE = 1000
+_EXPORT_STATEMENT_TIMEOUT = "300s"
+_EXPORT_FIELDS = (
+    "id", "sender", "sender_domain", "recipient", "subject",
+    "received_at", "ai_category", "confidence_score",
+    "review_status", "analyst_category", "reviewed_by", "reviewed_at",
+)
 
-# ── CSV export ─────────────────────────────────────────────────────────────────
 
 @router.get("/export/csv")
 async def export_emails(
     category: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     analyst: Optional[str] = Query(None, description="Analyst name for audit log"),
-    db: AsyncSession = Depends(get_db),
 ) -> StreamingResponse:
-    query = select(Email).order_by(Email.received_at.desc())
+    query = (
+        select(Email)
+        .order_by(Email.received_at.desc())
+        .execution_options(yield_per=_EXPORT_CHUNK_SIZE)
+    )
     if category:
         query = query.where(Email.ai_category == category)
     if status:
         query = query.where(Email.review_status == status)
 
-    result = await db.execute(query)
-    emails = list(result.scalars().all())
-
-    # Build CSV in-memory
-    output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=[
-            "id", "sender", "sender_domain", "recipient", "subject",
-            "received_at", "ai_category", "confidence_score",
-            "review_status", "analyst_category", "reviewed_by", "reviewed_at",
-        ],
-    )
-    writer.writeheader()
-    for e in emails:
-        writer.writerow(
-            {
-                "id": str(e.id),
-                "sender": e.sender,
-                "sender_domain": e.sender_domain,
-                "recipient": e.recipient,
-                "subject": e.subject,
-                "received_at": e.received_at.isoformat(),
-                "ai_category": e.ai_category,
-                "confidence_score": e.confidence_score,
-                "review_status": e.review_status,
-                "analyst_category": e.analyst_category or "",
-                "reviewed_by": e.reviewed_by or "",
-                "reviewed_at": e.reviewed_at.isoformat() if e.reviewed_at else "",
-            }
-        )
-
-    # Audit log the export
-    if analyst:
-        db.add(
-            AuditLog(
-                analyst=analyst,
-                action="export",
-                detail=f"Exported {len(emails)} emails to CSV",
-            )
-        )
-        await db.commit()
+    async def generate() -> AsyncIterator[str]:
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(_EXPORT_FIELDS)
+        yield output.getvalue()
+
+        # The request-scoped session is closed before the body is sent, so the
+        # stream owns its session; the server-side cursor needs a transaction.
+        exported = 0
+        async with AsyncSessionLocal() as db:
+            # Full exports legitimately outlive the default statement_timeout
+            await db.execute(text(f"SET LOCAL statement_timeout = '{_EXPORT_STATEMENT_TIMEOUT}'"))
+            result = await db.stream(query)
+            async for partition in result.scalars().partitions():
+                output.seek(0)
+                output.truncate()
+                for e in partition:
+                    writer.writerow(
+                        (
+                            str(e.id),
+                            e.sender,
+                            e.sender_domain,
+                            e.recipient,
+                            e.subject,
+                            e.received_at.isoformat(),
+                            e.ai_category,
+                            e.confidence_score,
+                            e.review_status,
+                            e.analyst_category or "",
+                            e.reviewed_by or "",
+                            e.reviewed_at.isoformat() if e.reviewed_at else "",
+                        )
+                    )
+                exported += len(partition)
+                yield output.getvalue()
+
+            # Audit log the export
+            if analyst:
+                db.add(
+                    AuditLog(
+                        analyst=analyst,
+                        action="export",
+                        detail=f"Exported {exported} emails to CSV",
+                    )
+                )
+                await db.commit()
 
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=phishdefender_emails.csv"},
     )
@@ -14,14 +14,27 @@ GET    /api/settings/mailboxes               — List mailboxes
 """
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
-from typing import List
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import ReadOnlySessionLocal, get_db, get_db_ro
+from app.jobs.scheduler import invalidate_settings_cache, trigger_ingestion
 from app.models.custom_rule import CustomRule
 from app.models.mailbox import Mailbox
 from app.models.settings import AppSettings
@@ -36,6 +49,50 @@ from app.schemas.settings import (
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
+_SchemaT = TypeVar("_SchemaT", bound=BaseModel)
+
+# Column names are fixed at import; rows read back from our own tables are
+# already schema-constrained, so read paths use model_construct (no validation).
+_RULE_COLUMNS: Tuple[str, ...] = tuple(c.name for c in CustomRule.__table__.columns)
+_MAILBOX_COLUMNS: Tuple[str, ...] = tuple(c.name for c in Mailbox.__table__.columns)
+_SETTINGS_COLUMNS: Tuple[str, ...] = tuple(c.name for c in AppSettings.__table__.columns)
+
+
+# List endpoints serialize in one pass through these and return the bytes
+# directly; response_model is kept for the OpenAPI schema only.
+_RULES_ADAPTER = TypeAdapter(List[CustomRuleOut])
+_MAILBOXES_ADAPTER = TypeAdapter(List[MailboxOut])
+
+
+def _row_to_schema(
+    row: object, schema_cls: Type[_SchemaT], columns: Tuple[str, ...]
+) -> _SchemaT:
+    """Build a response schema from a trusted ORM row without re-validating it."""
+    return schema_cls.model_construct(**{name: getattr(row, name) for name in columns})
+
+
+# ── Helper: request bodies validated straight from the raw JSON bytes ────────
+# Write endpoints read the body themselves and hand it to model_validate_json,
+# skipping the json.loads → dict → model hop; openapi_extra keeps the docs.
+
+def _json_request_body(schema_cls: Type[BaseModel]) -> Dict[str, Any]:
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema_cls.model_json_schema()}},
+        }
+    }
+
+
+async def _parse_body(request: Request, schema_cls: Type[_SchemaT]) -> _SchemaT:
+    try:
+        return schema_cls.model_validate_json(await request.body())
+    except ValidationError as exc:
+        # Same 422 shape FastAPI produces for declared body parameters
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        ) from exc
+
 
 # ── Helper: get or create the singleton settings row ──────────────────────────
 
@@ -49,32 +106,99 @@ async def _get_settings(db: AsyncSession) -> AppSettings:
     return row
 
 
+# ── Helper: TTL cache of the settings row for the read path ───────────────────
+# Stores plain column values (never the session-bound ORM instance). Writers
+# commit first and then drop the cache so the next read sees their change.
+
+_SETTINGS_TTL = 5.0  # seconds
+_settings_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _invalidate_settings_values() -> None:
+    global _settings_cache
+    _settings_cache = None
+
+
+async def _get_settings_values(db: AsyncSession) -> Dict[str, Any]:
+    """Return the settings row's column values, re-reading at most every _SETTINGS_TTL seconds."""
+    global _settings_cache
+    now = time.monotonic()
+    if _settings_cache is not None and now - _settings_cache[0] < _SETTINGS_TTL:
+        return _settings_cache[1]
+
+    row = await _get_settings(db)
+    values = {name: getattr(row, name) for name in _SETTINGS_COLUMNS}
+    _settings_cache = (now, values)
+    return values
+
+
+# ── Helpers: rules / mailboxes on their own read-only sessions ────────────────
+# An AsyncSession can't run statements concurrently, so these open short-lived
+# sessions (separate pooled connections) to overlap with the settings query.
+
+async def _fetch_rules() -> List[CustomRule]:
+    async with ReadOnlySessionLocal() as db:
+        result = await db.execute(select(CustomRule).order_by(CustomRule.created_at))
+        return list(result.scalars().all())
+
+
+async def _fetch_mailboxes() -> List[Mailbox]:
+    async with ReadOnlySessionLocal() as db:
+        result = await db.execute(select(Mailbox).order_by(Mailbox.created_at))
+        return list(result.scalars().all())
+
+
 # ── Full settings GET ──────────────────────────────────────────────────────────
 
 @router.get("", response_model=SettingsOut)
 async def get_settings(db: AsyncSession = Depends(get_db)) -> SettingsOut:
-    row = await _get_settings(db)
+    values, rules, mailboxes = await asyncio.gather(
+        _get_settings_values(db), _fetch_rules(), _fetch_mailboxes()
+    )
+
+    return SettingsOut(
+        **values,
+        custom_rules=[_row_to_schema(r, CustomRuleOut, _RULE_COLUMNS) for r in rules],
+        mailboxes=[_row_to_schema(m, MailboxOut, _MAILBOX_COLUMNS) for m in mailboxes],
+    )
 
-    rules_result = await db.execute(select(CustomRule).order_by(CustomRule.created_at))
-    rules = list(rules_result.scalars().all())
 
-    mb_result = await db.execute(select(Mailbox).order_by(Mailbox.created_at))
-    mailboxes = list(mb_result.scalars().all())
+# ── Helper: response for the settings PATCH endpoints ─────────────────────────
 
-    return SettingsOut(
-        **{c.name: getattr(row, c.name) for c in AppSettings.__table__.columns},
-        custom_rules=[CustomRuleOut.model_validate(r) for r in rules],
-        mailboxes=[MailboxOut.model_validate(m) for m in mailboxes],
+_INCLUDE_RELATED_HELP = "Also return custom_rules and mailboxes (two extra queries)"
+
+
+async def _updated_settings(
+    db: AsyncSession, row: AppSettings, include_related: bool
+) -> SettingsOut:
+    """Commit a settings change and build the PATCH response from the row."""
+    # Set client-side so the server onupdate doesn't expire it on flush
+    row.updated_at = datetime.now(timezone.utc)
+    await db.commit()
+    _invalidate_settings_values()
+    if include_related:
+        return await get_settings(db)
+    return SettingsOut.model_construct(
+        **{name: getattr(row, name) for name in _SETTINGS_COLUMNS},
+        custom_rules=[],
+        mailboxes=[],
     )
 
 
 # ── Threshold update ───────────────────────────────────────────────────────────
 
-@router.patch("/thresholds", response_model=SettingsOut)
+@router.patch(
+    "/thresholds",
+    response_model=SettingsOut,
+    openapi_extra=_json_request_body(SettingsUpdateThresholds),
+)
 async def update_thresholds(
-    body: SettingsUpdateThresholds,
+    request: Request,
+    include_related: bool = Query(False, description=_INCLUDE_RELATED_HELP),
     db: AsyncSession = Depends(get_db),
 ) -> SettingsOut:
+    """Update the AI thresholds. Lists are empty unless include_related=true."""
+    body = await _parse_body(request, SettingsUpdateThresholds)
     if body.low_malicious_threshold >= body.high_malicious_threshold:
         raise HTTPException(
             status_code=422,
@@ -83,17 +207,23 @@ async def update_thresholds(
     row = await _get_settings(db)
     row.high_malicious_threshold = body.high_malicious_threshold
     row.low_malicious_threshold = body.low_malicious_threshold
-    db.add(row)
-    return await get_settings(db)
+    return await _updated_settings(db, row, include_related)
 
 
 # ── Notifications update ───────────────────────────────────────────────────────
 
-@router.patch("/notifications", response_model=SettingsOut)
+@router.patch(
+    "/notifications",
+    response_model=SettingsOut,
+    openapi_extra=_json_request_body(SettingsUpdateNotifications),
+)
 async def update_notifications(
-    body: SettingsUpdateNotifications,
+    request: Request,
+    include_related: bool = Query(False, description=_INCLUDE_RELATED_HELP),
     db: AsyncSession = Depends(get_db),
 ) -> SettingsOut:
+    """Update notification preferences. Lists are empty unless include_related=true."""
+    body = await _parse_body(request, SettingsUpdateNotifications)
     row = await _get_settings(db)
     if body.notify_high_malicious_spike is not None:
         row.notify_high_malicious_spike = body.notify_high_malicious_spike
@@ -101,8 +231,7 @@ async def update_notifications(
         row.notify_job_failure = body.notify_job_failure
     if body.notify_daily_digest is not None:
         row.notify_daily_digest = body.notify_daily_digest
-    db.add(row)
-    return await get_settings(db)
+    return await _updated_settings(db, row, include_related)
 
 
 # ── Job controls ───────────────────────────────────────────────────────────────
@@ -111,7 +240,9 @@ async def update_notifications(
 async def pause_job(db: AsyncSession = Depends(get_db)) -> dict:
     row = await _get_settings(db)
     row.job_status = "paused"
-    db.add(row)
+    await db.commit()
+    invalidate_settings_cache()
+    _invalidate_settings_values()
     return {"success": True, "job_status": "paused"}
 
 
@@ -119,34 +250,42 @@ async def pause_job(db: AsyncSession = Depends(get_db)) -> dict:
 async def resume_job(db: AsyncSession = Depends(get_db)) -> dict:
     row = await _get_settings(db)
     row.job_status = "idle"
-    db.add(row)
+    await db.commit()
+    invalidate_settings_cache()
+    _invalidate_settings_values()
     return {"success": True, "job_status": "idle"}
 
 
 @router.post("/job/trigger")
-async def trigger_job(
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
-) -> dict:
-    """Manually kick off an ingestion run in the background."""
-    from app.services.ingestion import run_ingestion  # deferred to avoid circular
-    background_tasks.add_task(run_ingestion)
+async def trigger_job() -> dict:
+    """Manually kick off an ingestion run as a detached asyncio task."""
+    if not trigger_ingestion():
+        return {"success": True, "message": "Ingestion job already running"}
     return {"success": True, "message": "Ingestion job triggered"}
 
 
 # ── Custom rules CRUD ──────────────────────────────────────────────────────────
 
 @router.get("/rules", response_model=List[CustomRuleOut])
-async def list_rules(db: AsyncSession = Depends(get_db)) -> List[CustomRuleOut]:
+async def list_rules(db: AsyncSession = Depends(get_db_ro)) -> Response:
     result = await db.execute(select(CustomRule).order_by(CustomRule.created_at))
-    return [CustomRuleOut.model_validate(r) for r in result.scalars().all()]
+    rules = [
+        _row_to_schema(r, CustomRuleOut, _RULE_COLUMNS) for r in result.scalars().all()
+    ]
+    return Response(content=_RULES_ADAPTER.dump_json(rules), media_type="application/json")
 
 
-@router.post("/rules", response_model=CustomRuleOut, status_code=201)
+@router.post(
+    "/rules",
+    response_model=CustomRuleOut,
+    status_code=201,
+    openapi_extra=_json_request_body(CustomRuleCreate),
+)
 async def create_rule(
-    body: CustomRuleCreate,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> CustomRuleOut:
+    body = await _parse_body(request, CustomRuleCreate)
     rule = CustomRule(
         rule_type=body.rule_type,
         value=body.value,
@@ -173,6 +312,11 @@ async def delete_rule(
 # ── Mailboxes (read-only from API; managed via .env or DB seeding) ─────────────
 
 @router.get("/mailboxes", response_model=List[MailboxOut])
-async def list_mailboxes(db: AsyncSession = Depends(get_db)) -> List[MailboxOut]:
+async def list_mailboxes(db: AsyncSession = Depends(get_db_ro)) -> Response:
     result = await db.execute(select(Mailbox).order_by(Mailbox.created_at))
-    return [MailboxOut.model_validate(m) for m in result.scalars().all()]
+    mailboxes = [
+        _row_to_schema(m, MailboxOut, _MAILBOX_COLUMNS) for m in result.scalars().all()
+    ]
+    return Response(
+        content=_MAILBOXES_ADAPTER.dump_json(mailboxes), media_type="application/json"
+    )
@@ -7,13 +7,17 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Upper bound on similar emails returned with a detail view
+MAX_SIMILAR_EMAILS = 10
 
 
 # ── Threat Indicators ──────────────────────────────────────────────────────────
 
 class ThreatIndicatorOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     indicator_type: str  # "url" | "domain" | "ip"
@@ -24,7 +28,7 @@ class ThreatIndicatorOut(BaseModel):
 # ── Per-email audit trail ──────────────────────────────────────────────────────
 
 class AuditTrailEntryOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     timestamp: datetime
@@ -36,7 +40,7 @@ class AuditTrailEntryOut(BaseModel):
 # ── Email list item (compact) ──────────────────────────────────────────────────
 
 class EmailListItem(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: uuid.UUID
     sender: str
@@ -78,6 +82,9 @@ class EmailDetail(BaseModel):
     reviewed_at: Optional[datetime] = None
 
     similar_email_ids: Optional[List[uuid.UUID]] = None
+    # Hydrated in one query by the detail and override endpoints
+    # (see app.services.emails.fetch_emails_by_ids)
+    similar_emails: List[EmailListItem] = []
 
     threat_indicators: List[ThreatIndicatorOut] = []
     audit_trail: List[AuditTrailEntryOut] = []
@@ -85,6 +92,11 @@ class EmailDetail(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("similar_email_ids")
+    @classmethod
+    def _cap_similar(cls, v: Optional[List[uuid.UUID]]) -> Optional[List[uuid.UUID]]:
+        return v[:MAX_SIMILAR_EMAILS] if v else v
+
 
 # ── Paginated list response ────────────────────────────────────────────────────
 
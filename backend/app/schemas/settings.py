@@ -13,7 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field
 # ── Custom Rules ───────────────────────────────────────────────────────────────
 
 class CustomRuleOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: uuid.UUID
     rule_type: str           # "domain" | "keyword"
@@ -36,7 +36,7 @@ class CustomRuleCreate(BaseModel):
 # ── Mailbox ────────────────────────────────────────────────────────────────────
 
 class MailboxOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: uuid.UUID
     address: str
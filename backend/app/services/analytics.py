@@ -4,61 +4,137 @@ app/services/analytics.py — Database-backed analytics aggregation queries.
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import case, func, select, text
+from sqlalchemy import Select, Subquery, case, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.audit_log import AuditLog
-from app.models.email import Email, ThreatIndicator
+from app.models.email import Email, KeywordHit, ThreatIndicator
+
+# Phrases counted for the analytics keyword chart. Ingestion matches them
+# against each email's reasoning and stores the result in keyword_hits.
+PHISHING_KEYWORDS: Tuple[str, ...] = (
+    "verify your account", "urgent action required",
+    "password expired", "wire transfer",
+    "confirm your identity", "unusual activity",
+    "click here immediately", "account suspended",
+    "invoice attached", "delivery failed",
+    "sign the document", "subscription renewal",
+)
+
+
+def match_phishing_keywords(reasoning: Optional[List[str]]) -> List[Tuple[str, int]]:
+    """Return (keyword, bullets mentioning it) for each PHISHING_KEYWORDS hit."""
+    if not reasoning:
+        return []
+    lowered = [r.lower() for r in reasoning]
+    hits: List[Tuple[str, int]] = []
+    for keyword in PHISHING_KEYWORDS:
+        count = sum(keyword in r for r in lowered)
+        if count:
+            hits.append((keyword, count))
+    return hits
+
+
+async def _json_array(
+    db: AsyncSession,
+    query: Select,
+    fields: Tuple[str, ...],
+    order_by: Callable[[Subquery], Any],
+) -> str:
+    """
+    Run `query` and have Postgres return its rows as a JSON array of objects
+    with the given keys (taken from the query's column labels), ordered by
+    `order_by(subquery)`.  The text is passed to the client as-is.
+    """
+    t = query.subquery("t")
+    obj = func.json_build_object(
+        *(arg for name in fields for arg in (literal_column(f"'{name}'"), t.c[name]))
+    )
+    agg = func.json_agg(aggregate_order_by(obj, order_by(t)))
+    return await db.scalar(select(func.coalesce(agg, literal_column("'[]'::json"))))
 
 
-async def get_category_trend(
-    db: AsyncSession, days: int = 30
-) -> List[Dict[str, Any]]:
-    """Return daily category counts for the past `days` days."""
-    since = datetime.now(timezone.utc) - timedelta(days=days)
+async def get_category_trend(db: AsyncSession, days: int = 30) -> str:
+    """Return daily category counts for the past `days` days as a JSON array."""
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).date()
 
-    rows = await db.execute(
+    # One GROUP BY (day, category) pass over emails, then a per-day pivot of
+    # those few aggregate rows
+    c = (
         select(
-            func.date(Email.received_at).label("date"),
-            func.count(case((Email.ai_category == "high_malicious", 1))).label(
-                "high_malicious"
-            ),
-            func.count(case((Email.ai_category == "low_malicious", 1))).label(
-                "low_malicious"
-            ),
-            func.count(case((Email.ai_category == "safe", 1))).label("safe"),
+            Email.received_date.label("date"),
+            Email.ai_category,
+            func.count().label("n"),
         )
-        .where(Email.received_at >= since)
-        .group_by(func.date(Email.received_at))
-        .order_by(func.date(Email.received_at))
+        .where(Email.received_date >= since)
+        .group_by(Email.received_date, Email.ai_category)
+        .subquery("c")
     )
 
-    return [
-        {
-            "date": str(r.date),
-            "high_malicious": r.high_malicious,
-            "low_malicious": r.low_malicious,
-            "safe": r.safe,
-        }
-        for r in rows
-    ]
+    def category_total(category: str) -> Any:
+        return func.coalesce(func.sum(c.c.n).filter(c.c.ai_category == category), 0)
+
+    per_day = select(
+        c.c.date,
+        category_total("high_malicious").label("high_malicious"),
+        category_total("low_malicious").label("low_malicious"),
+        category_total("safe").label("safe"),
+    ).group_by(c.c.date)
+    return await _json_array(
+        db,
+        per_day,
+        ("date", "high_malicious", "low_malicious", "safe"),
+        lambda t: t.c.date,
+    )
 
 
-async def get_accuracy_stats(db: AsyncSession) -> Dict[str, Any]:
-    """Compute AI accuracy metrics from override audit log entries."""
-    total_result = await db.execute(
-        select(func.count(Email.id)).where(
-            Email.review_status.in_(["reviewed", "overridden"])
+def _short_category(column: Any) -> Any:
+    """SQL expression mapping high_malicious/low_malicious to high/low."""
+    return case(
+        (column == "high_malicious", "high"),
+        (column == "low_malicious", "low"),
+        else_=column,
+    )
+
+
+async def _override_directions(db: AsyncSession) -> Dict[str, int]:
+    """Override counts keyed by direction label, e.g. {"high_to_safe": 3}."""
+    direction = func.concat(
+        _short_category(AuditLog.previous_category),
+        "_to_",
+        _short_category(AuditLog.new_category),
+    ).label("direction")
+    result = await db.execute(
+        select(direction, func.count().label("cnt"))
+        .where(
+            AuditLog.action == "override",
+            AuditLog.previous_category.is_not(None),
+            AuditLog.new_category.is_not(None),
         )
+        .group_by(direction)
     )
-    total_reviewed: int = total_result.scalar_one() or 0
+    return {row.direction: row.cnt for row in result}
+
 
-    override_result = await db.execute(
-        select(func.count(Email.id)).where(Email.review_status == "overridden")
+async def get_accuracy_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Compute AI accuracy metrics from override audit log entries."""
+    # reviewed + overridden totals in a single pass; the WHERE lets Postgres
+    # count from ix_emails_status_received instead of scanning all of emails
+    counts_result = await db.execute(
+        select(
+            func.count().label("reviewed"),
+            func.count().filter(Email.review_status == "overridden").label("overridden"),
+        )
+        .select_from(Email)
+        .where(Email.review_status.in_(["reviewed", "overridden"]))
     )
-    total_overrides: int = override_result.scalar_one() or 0
+    counts = counts_result.one()
+    breakdown = await _override_directions(db)
+    total_reviewed: int = counts.reviewed
+    total_overrides: int = counts.overridden
 
     agreement_rate = (
         round((total_reviewed - total_overrides) / total_reviewed, 4)
@@ -66,25 +142,6 @@ async def get_accuracy_stats(db: AsyncSession) -> Dict[str, Any]:
         else 0.0
     )
 
-    # Direction breakdown from AuditLog
-    direction_rows = await db.execute(
-        select(
-            AuditLog.previous_category,
-            AuditLog.new_category,
-            func.count(AuditLog.id).label("cnt"),
-        )
-        .where(AuditLog.action == "override")
-        .group_by(AuditLog.previous_category, AuditLog.new_category)
-    )
-
-    breakdown: Dict[str, int] = {}
-    for row in direction_rows:
-        if row.previous_category and row.new_category:
-            key = f"{row.previous_category}_to_{row.new_category}".replace(
-                "high_malicious", "high"
-            ).replace("low_malicious", "low")
-            breakdown[key] = row.cnt
-
     return {
         "ai_agreement_rate": agreement_rate,
         "total_reviewed": total_reviewed,
@@ -98,13 +155,11 @@ async def get_accuracy_stats(db: AsyncSession) -> Dict[str, Any]:
     }
 
 
-async def get_top_malicious_domains(
-    db: AsyncSession, limit: int = 10
-) -> List[Dict[str, Any]]:
-    """Top sender domains associated with high/low malicious emails."""
-    rows = await db.execute(
+async def get_top_malicious_domains(db: AsyncSession, limit: int = 10) -> str:
+    """Top sender domains associated with high/low malicious emails (JSON array)."""
+    query = (
         select(
-            Email.sender_domain,
+            Email.sender_domain.label("domain"),
             func.count(Email.id).label("count"),
         )
         .where(Email.ai_category.in_(["high_malicious", "low_malicious"]))
@@ -112,62 +167,47 @@ async def get_top_malicious_domains(
         .order_by(func.count(Email.id).desc())
         .limit(limit)
     )
-    return [{"domain": r.sender_domain, "count": r.count} for r in rows]
+    return await _json_array(
+        db, query, ("domain", "count"), lambda t: t.c["count"].desc()
+    )
 
 
-async def get_phishing_keywords(
-    db: AsyncSession, limit: int = 12
-) -> List[Dict[str, Any]]:
+async def get_phishing_keywords(db: AsyncSession, limit: int = 12) -> str:
     """
-    Aggregate keyword hit counts from AI reasoning bullets.
-    This is an approximate match — counts emails whose reasoning mentions each term.
-    For production replace with a dedicated keyword_hits table populated at ingestion.
+    Aggregate keyword hit counts from AI reasoning bullets (JSON array).
+    Reads the keyword_hits rows written at ingestion (see match_phishing_keywords).
     """
-    # We use a raw SQL unnest + ILIKE approach on the ai_reasoning array
-    sql = text(
-        """
-        SELECT kw.keyword, COUNT(*) AS count
-        FROM emails e,
-             unnest(e.ai_reasoning) AS reason,
-             (VALUES
-               ('verify your account'),('urgent action required'),
-               ('password expired'),('wire transfer'),
-               ('confirm your identity'),('unusual activity'),
-               ('click here immediately'),('account suspended'),
-               ('invoice attached'),('delivery failed'),
-               ('sign the document'),('subscription renewal')
-             ) AS kw(keyword)
-        WHERE reason ILIKE '%' || kw.keyword || '%'
-          AND e.ai_category IN ('high_malicious','low_malicious')
-        GROUP BY kw.keyword
-        ORDER BY count DESC
-        LIMIT :limit
-        """
+    total = func.sum(KeywordHit.hit_count)
+    query = (
+        select(KeywordHit.keyword, total.label("count"))
+        .where(KeywordHit.ai_category.in_(["high_malicious", "low_malicious"]))
+        .group_by(KeywordHit.keyword)
+        .order_by(total.desc())
+        .limit(limit)
+    )
+    return await _json_array(
+        db, query, ("keyword", "count"), lambda t: t.c["count"].desc()
     )
-    rows = await db.execute(sql, {"limit": limit})
-    return [{"keyword": r.keyword, "count": r.count} for r in rows]
 
 
-async def get_analyst_activity(db: AsyncSession) -> List[Dict[str, Any]]:
-    """Per-analyst review and override counts from the audit log."""
-    rows = await db.execute(
+async def get_analyst_activity(db: AsyncSession) -> str:
+    """Per-analyst review and override counts from the audit log (JSON array)."""
+    query = (
         select(
             AuditLog.analyst,
-            func.count(AuditLog.id).label("total_actions"),
-            func.count(case((AuditLog.action == "reviewed", 1))).label("reviewed_count"),
-            func.count(case((AuditLog.action == "override", 1))).label("override_count"),
+            func.count().filter(AuditLog.action == "reviewed").label("reviewed_count"),
+            func.count().filter(AuditLog.action == "override").label("override_count"),
+            func.count().label("total_actions"),
+            # avg_review_time: not tracked yet — return placeholder
+            literal_column("0.0").label("avg_review_time_minutes"),
         )
+        # Matches ix_audit_log_analyst_action's predicate, so it can be used
         .where(AuditLog.analyst != "system")
         .group_by(AuditLog.analyst)
-        .order_by(func.count(AuditLog.id).desc())
     )
-    return [
-        {
-            "analyst": r.analyst,
-            "reviewed_count": r.reviewed_count,
-            "override_count": r.override_count,
-            # avg_review_time: not tracked yet — return placeholder
-            "avg_review_time_minutes": 0.0,
-        }
-        for r in rows
-    ]
+    return await _json_array(
+        db,
+        query,
+        ("analyst", "reviewed_count", "override_count", "avg_review_time_minutes"),
+        lambda t: t.c.total_actions.desc(),
+    )
@@ -0,0 +1,31 @@
+"""
+app/services/emails.py — Email lookups shared by the email endpoints.
+"""
+from __future__ import annotations
+
+import uuid
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.email import Email
+from app.schemas.email import EmailDetail, EmailListItem
+
+
+async def fetch_emails_by_ids(db: AsyncSession, ids: List[uuid.UUID]) -> List[Email]:
+    """Load several emails in one query, returned in the order of `ids`."""
+    if not ids:
+        return []
+    result = await db.execute(select(Email).where(Email.id.in_(ids)))
+    by_id = {e.id: e for e in result.scalars().all()}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+async def build_email_detail(db: AsyncSession, email: Email) -> EmailDetail:
+    """Build an EmailDetail with similar_emails hydrated from similar_email_ids."""
+    detail = EmailDetail.model_validate(email)
+    if detail.similar_email_ids:
+        similar = await fetch_emails_by_ids(db, detail.similar_email_ids)
+        detail.similar_emails = [EmailListItem.model_validate(e) for e in similar]
+    return detail
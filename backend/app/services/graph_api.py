@@ -3,7 +3,7 @@ app/services/graph_api.py — Microsoft Graph API integration.
 
 Handles:
   - OAuth2 client credentials token acquisition via MSAL
-  - Listing messages in a shared mailbox
+  - Streaming messages from a shared mailbox
   - Fetching full message details (headers + HTML body + attachments list)
   - Incremental fetching using delta links to avoid reprocessing seen messages
   - Graceful fallback when Azure credentials are not configured (dev mode)
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 import httpx
 import msal
@@ -38,6 +38,8 @@ class GraphAPIClient:
         self._settings = get_settings()
         self._msal_app: Optional[msal.ConfidentialClientApplication] = None
         self._http: Optional[httpx.AsyncClient] = None
+        # Set by iter_messages() once the last page has been read
+        self.next_delta_link: Optional[str] = None
 
     # ── Lifecycle ──────────────────────────────────────────────────────────
 
@@ -85,14 +87,15 @@ class GraphAPIClient:
 
     # ── Message listing ────────────────────────────────────────────────────
 
-    async def list_messages(
+    async def iter_messages(
         self,
         mailbox: str,
         delta_link: Optional[str] = None,
         top: int = 50,
-    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Fetch new/changed messages from a shared mailbox using Graph delta queries.
+        Yield new/changed messages from a shared mailbox using Graph delta queries,
+        one page at a time as each page arrives.
 
         Parameters
         ----------
@@ -100,16 +103,13 @@ class GraphAPIClient:
         delta_link: The delta link from the previous poll (None on first call).
         top:        Max messages to return per page.
 
-        Returns
-        -------
-        (messages, next_delta_link)
-          messages:         List of raw Graph message dicts.
-          next_delta_link:  The delta link to store for the next poll.
+        Once the generator is exhausted, ``self.next_delta_link`` holds the
+        delta link to store for the next poll (None if Graph returned none).
         """
         assert self._http is not None, "Use as async context manager"
 
         if delta_link:
-            url = delta_link
+            url: Optional[str] = delta_link
         else:
             # Initial call — request a delta for the inbox
             url = (
@@ -118,28 +118,24 @@ class GraphAPIClient:
                 f"&$select=id,subject,from,toRecipients,receivedDateTime,body,isRead"
             )
 
-        messages: List[Dict[str, Any]] = []
-        next_delta: Optional[str] = None
+        self.next_delta_link = None
 
         while url:
             resp = await self._http.get(url, headers=self._auth_headers())
             resp.raise_for_status()
             data = resp.json()
 
-            page_messages = data.get("value", [])
-            messages.extend(page_messages)
-
             # Check for next page or delta link
             if "@odata.nextLink" in data:
                 url = data["@odata.nextLink"]
-                next_delta = None  # not at the end yet
             elif "@odata.deltaLink" in data:
-                next_delta = data["@odata.deltaLink"]
+                self.next_delta_link = data["@odata.deltaLink"]
                 url = None  # done
             else:
                 url = None
 
-        return messages, next_delta
+            for message in data.get("value", []):
+                yield message
 
     # ── Full message fetch ─────────────────────────────────────────────────
 
@@ -183,14 +179,19 @@ class GraphAPIClient:
         return ""
 
     @staticmethod
-    def extract_received_at(message: Dict[str, Any]) -> datetime:
-        """Parse the receivedDateTime string into an aware datetime."""
+    def extract_received_at(
+        message: Dict[str, Any], default: Optional[datetime] = None
+    ) -> datetime:
+        """
+        Parse the receivedDateTime string into an aware datetime.
+        Falls back to `default` (or the current time) if it can't be parsed.
+        """
         raw: str = message.get("receivedDateTime", "")
         try:
             dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
             return dt
         except (ValueError, AttributeError):
-            return datetime.now(timezone.utc)
+            return default if default is not None else datetime.now(timezone.utc)
 
     @staticmethod
     def extract_body(message: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
@@ -4,8 +4,8 @@ app/services/ingestion.py — Email ingestion pipeline.
 Responsibilities:
   1. Poll each active mailbox via the Graph API (delta queries).
   2. De-duplicate against already-ingested graph_message_ids.
-  3. Run the AI classifier on each new message.
-  4. Apply any active custom rules (force-category overrides).
+  3. Apply any active custom rules (force-category overrides).
+  4. Run the AI classifier on each new message not forced by a rule.
   5. Extract threat indicators (URLs, domains, IPs) from the message body.
   6. Persist the Email record and its related rows to PostgreSQL.
   7. Update the Mailbox delta_link and last_polled_at.
@@ -13,38 +13,62 @@ Responsibilities:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import String, any_, cast, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
-from app.database import AsyncSessionLocal
+from app.database import AsyncSessionLocal, bulk_copy
 from app.models.audit_log import AuditLog
 from app.models.custom_rule import CustomRule
-from app.models.email import AuditTrailEntry, Email, ThreatIndicator
+from app.models.email import AuditTrailEntry, Email, KeywordHit, ThreatIndicator
 from app.models.mailbox import Mailbox
 from app.models.settings import AppSettings
+from app.services.analytics import match_phishing_keywords
 from app.services.graph_api import GraphAPIClient, get_graph_client
+from app.services.openai_classifier import EmailInput, OpenAIClassifier
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-VALUES INSERT — Postgres throughput plateaus around 1k rows,
+# and 1k emails stay well under asyncpg's 32767 bind-parameter limit.
+_INSERT_BATCH_SIZE = 1000
+
+# Above this many new messages in one poll (e.g. a mailbox's first sync),
+# the remaining messages go in with binary COPY, this many per chunk, instead
+# of batched INSERTs.
+_COPY_THRESHOLD = 5000
+
+# Message bodies longer than this (characters) are classified in a worker
+# thread instead of on the event loop.
+_THREAD_BODY_CHARS = 64_000
+
 
 # ── Regex patterns for threat indicator extraction ─────────────────────────────
 
-_URL_RE = re.compile(
-    r"https?://[^\s\"'<>]+",
+# URLs and IPs in one alternation so the body is scanned once.  `host` is
+# the URL's hostname (no userinfo or port), used for the domain indicators.
+_INDICATOR_RE = re.compile(
+    r"(?P<url>https?://(?:[^/\s\"'<>@?#]*@)?(?P<host>[^/\s\"'<>@:?#]+)[^\s\"'<>]*)"
+    r"|(?P<ip>\b(?:\d{1,3}\.){3}\d{1,3}\b)",
     re.IGNORECASE,
 )
 _IP_RE = re.compile(
     r"\b(?:\d{1,3}\.){3}\d{1,3}\b"
 )
 
+# Hard caps on indicators kept per message
+_MAX_URLS = 50
+_MAX_IPS = 20
+
 
 # ── Simple rule-based AI classifier ───────────────────────────────────────────
 
@@ -62,17 +86,32 @@ class SimpleClassifier:
     Returns (category, confidence, reasoning_bullets)
     """
 
-    HIGH_KEYWORDS = [
+    # Stateless: no per-instance __dict__
+    __slots__ = ()
+
+    # Immutable tuples, scanned in order when reporting matches
+    HIGH_KEYWORDS = (
         "verify your account", "urgent action required", "password expired",
         "wire transfer", "confirm your identity", "your account has been suspended",
         "click here immediately", "login to restore", "account verification required",
         "we detected unusual activity",
-    ]
-    LOW_KEYWORDS = [
+    )
+    LOW_KEYWORDS = (
         "invoice attached", "delivery failed", "your package", "sign the document",
         "subscription renewal", "limited time offer", "you have been selected",
-    ]
-    SUSPICIOUS_TLDS = {".ru", ".xyz", ".tk", ".cn", ".top", ".club", ".info"}
+    )
+    # Tuple so a single str.endswith() call checks them all
+    SUSPICIOUS_TLDS = (".ru", ".xyz", ".tk", ".cn", ".top", ".club", ".info")
+    # Digits replacing letters in common brand names
+    BRAND_TYPOS = ("paypa1", "amaz0n", "micr0soft", "g00gle", "app1e")
+
+    # Every keyword in one pattern, scanned once per message.  The lookahead
+    # makes it match at every position, so overlapping keywords are all found
+    # (same result as a separate `kw in text` per keyword).
+    _KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, HIGH_KEYWORDS + LOW_KEYWORDS)) + "))"
+    )
+    _BRAND_TYPO_RE = re.compile("|".join(map(re.escape, BRAND_TYPOS)))
 
     def classify(
         self,
@@ -83,13 +122,21 @@ class SimpleClassifier:
         ips: List[str],
         high_threshold: float,
         low_threshold: float,
+        text_lower: Optional[str] = None,
     ) -> Tuple[str, float, List[str]]:
+        """
+        `text_lower` may carry the caller's already-lowercased
+        "subject body_text" so the body isn't copied again here.
+        """
         score = 0.0
         reasoning: List[str] = []
-        text = (subject + " " + body_text).lower()
+        text = (
+            text_lower if text_lower is not None else (subject + " " + body_text).lower()
+        )
+        found = set(self._KEYWORD_RE.findall(text))
 
         # High-urgency keyword matches
-        matched_high = [kw for kw in self.HIGH_KEYWORDS if kw in text]
+        matched_high = [kw for kw in self.HIGH_KEYWORDS if kw in found]
         if matched_high:
             score += 0.15 * len(matched_high)
             reasoning.append(
@@ -97,7 +144,7 @@ class SimpleClassifier:
             )
 
         # Low-urgency keyword matches
-        matched_low = [kw for kw in self.LOW_KEYWORDS if kw in text]
+        matched_low = [kw for kw in self.LOW_KEYWORDS if kw in found]
         if matched_low and not matched_high:
             score += 0.08 * len(matched_low)
             reasoning.append(
@@ -106,21 +153,17 @@ class SimpleClassifier:
 
         # Suspicious sender TLD
         domain_lower = sender_domain.lower()
-        for tld in self.SUSPICIOUS_TLDS:
-            if domain_lower.endswith(tld):
-                score += 0.20
-                reasoning.append(f"Sender domain uses suspicious TLD: {tld}")
-                break
+        if domain_lower.endswith(self.SUSPICIOUS_TLDS):
+            tld = domain_lower[domain_lower.rfind("."):]
+            score += 0.20
+            reasoning.append(f"Sender domain uses suspicious TLD: {tld}")
 
         # Typosquatting heuristic: digits replacing letters in common brands
-        brand_patterns = ["paypa1", "amaz0n", "micr0soft", "g00gle", "app1e"]
-        for pat in brand_patterns:
-            if pat in domain_lower:
-                score += 0.25
-                reasoning.append(
-                    f"Possible typosquatted brand domain detected: {sender_domain}"
-                )
-                break
+        if self._BRAND_TYPO_RE.search(domain_lower):
+            score += 0.25
+            reasoning.append(
+                f"Possible typosquatted brand domain detected: {sender_domain}"
+            )
 
         # IP addresses in body (unusual for legitimate email)
         if ips:
@@ -156,22 +199,18 @@ class SimpleClassifier:
 # To switch to the Azure OpenAI classifier:
 #   1. Set AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_KEY, AZURE_OPENAI_DEPLOYMENT
 #      in backend/.env  (see .env.example for details).
-#   2. Replace the two lines below with:
+#   2. Replace the line below with:
 #
-#        from app.services.openai_classifier import OpenAIClassifier
 #        _classifier = OpenAIClassifier()
 #
-#   3. In _process_message() below, change the classify call from:
-#
-#        ai_category, confidence, reasoning = _classifier.classify(...)
-#
-#      to:
-#
-#        ai_category, confidence, reasoning = await _classifier.classify_async(...)
+#   ingest_mailbox then leaves classification out of _build_email() and sends
+#   each batch of new messages to classify_batch_async() just before it is
+#   written (see _complete_verdicts).
 #
 #   See backend/app/services/openai_classifier.py for full documentation.
 # ─────────────────────────────────────────────────────────────────────────────
 _classifier = SimpleClassifier()
+_BATCH_CLASSIFY = isinstance(_classifier, OpenAIClassifier)
 
 
 # ── Indicator extraction ───────────────────────────────────────────────────────
@@ -181,50 +220,104 @@ def extract_indicators(
 ) -> Tuple[List[str], List[str], List[str]]:
     """
     Extract (urls, domains, ips) from email body content.
+
+    An "@" in the query or fragment is not userinfo; the domain is still the
+    host the link points to:
+
+    >>> extract_indicators(None, "https://login.example.com?u=a@evil.com")
+    (['https://login.example.com?u=a@evil.com'], ['login.example.com'], [])
+    >>> extract_indicators(None, "http://user:pw@Evil.COM:8080/x 10.0.0.1")
+    (['http://user:pw@Evil.COM:8080/x'], ['evil.com'], ['10.0.0.1'])
     """
     content = (html or "") + " " + (text or "")
-    urls = list(dict.fromkeys(_URL_RE.findall(content)))  # dedup, preserve order
-    ips = list(dict.fromkeys(_IP_RE.findall(content)))
-
-    # Extract domains from found URLs
+    urls: List[str] = []
     domains: List[str] = []
-    for url in urls:
-        try:
-            parsed = urlparse(url)
-            if parsed.netloc:
-                domains.append(parsed.netloc.lower())
-        except Exception:
-            pass
-    domains = list(dict.fromkeys(domains))
+    ips: List[str] = []
+    seen_urls: set[str] = set()
+    seen_domains: set[str] = set()
+    seen_ips: set[str] = set()
+    # Dedup (keeping first-seen order) and cap while scanning; stop reading
+    # the body once both caps are full.
+    for m in _INDICATOR_RE.finditer(content):
+        if m.lastgroup == "url":
+            url = m.group()
+            if len(urls) < _MAX_URLS and url not in seen_urls:
+                seen_urls.add(url)
+                urls.append(url)
+                domain = m.group("host").lower()
+                if domain not in seen_domains:
+                    seen_domains.add(domain)
+                    domains.append(domain)
+            # The URL match consumes any IP host inside it; keep reporting it
+            found_ips = _IP_RE.findall(url)
+        else:
+            found_ips = [m.group()]
+        for ip in found_ips:
+            if len(ips) < _MAX_IPS and ip not in seen_ips:
+                seen_ips.add(ip)
+                ips.append(ip)
+        if len(urls) >= _MAX_URLS and len(ips) >= _MAX_IPS:
+            break
 
-    return urls[:50], domains[:50], ips[:20]  # hard caps
+    return urls, domains, ips
 
 
 # ── Custom rule matching ───────────────────────────────────────────────────────
 
-def apply_custom_rules(
-    subject: str,
-    body_text: str,
-    sender_domain: str,
-    rules: List[CustomRule],
-) -> Optional[str]:
-    """
-    Check active custom rules.  Returns force_category if a rule fires, else None.
-    Domain rules are checked first (higher precedence).
-    """
-    for rule in rules:
+class CompiledRules(NamedTuple):
+    """Active custom rules indexed once per mailbox poll (see compile_custom_rules)."""
+
+    # lowercased sender domain → force_category
+    domains: Dict[str, str]
+    # lowercased keyword → (rule position, force_category)
+    keywords: Dict[str, Tuple[int, str]]
+    # lookahead alternation of every keyword, or None if there are none
+    keyword_re: Optional[re.Pattern[str]]
+
+
+def compile_custom_rules(rules: List[CustomRule]) -> CompiledRules:
+    """Index active rules: a dict for domain rules, one pattern for keyword rules."""
+    domains: Dict[str, str] = {}
+    keywords: Dict[str, Tuple[int, str]] = {}
+    for position, rule in enumerate(rules):
         if not rule.is_active:
             continue
+        value = rule.value.lower()
         if rule.rule_type == "domain":
-            if sender_domain.lower() == rule.value.lower():
-                logger.debug("Custom domain rule matched: %s", rule.value)
-                return rule.force_category
+            domains.setdefault(value, rule.force_category)
         elif rule.rule_type == "keyword":
-            haystack = (subject + " " + body_text).lower()
-            if rule.value.lower() in haystack:
-                logger.debug("Custom keyword rule matched: %s", rule.value)
-                return rule.force_category
-    return None
+            keywords.setdefault(value, (position, rule.force_category))
+    keyword_re = (
+        re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        if keywords
+        else None
+    )
+    return CompiledRules(domains, keywords, keyword_re)
+
+
+def apply_custom_rules(
+    haystack_lower: str,
+    domain_lower: str,
+    rules: CompiledRules,
+) -> Optional[str]:
+    """
+    Check active custom rules against the lowercased "subject body_text" and
+    sender domain.  Returns force_category if a rule fires, else None.
+    Domain rules are checked first (higher precedence); among keyword rules the
+    earliest-listed match wins.
+    """
+    forced = rules.domains.get(domain_lower)
+    if forced is not None:
+        logger.debug("Custom domain rule matched: %s", domain_lower)
+        return forced
+    if rules.keyword_re is None:
+        return None
+    found = set(rules.keyword_re.findall(haystack_lower))
+    if not found:
+        return None
+    keyword = min(found, key=lambda kw: rules.keywords[kw][0])
+    logger.debug("Custom keyword rule matched: %s", keyword)
+    return rules.keywords[keyword][1]
 
 
 # ── Main ingestion function ────────────────────────────────────────────────────
@@ -235,42 +328,55 @@ async def ingest_mailbox(mailbox: Mailbox, settings_row: AppSettings) -> int:
     Returns the number of new emails ingested.
     """
     ingested = 0
+    # One timestamp for the whole poll: last_polled_at and the received_at
+    # fallback for messages without a parseable receivedDateTime
+    now = datetime.now(timezone.utc)
 
     async with AsyncSessionLocal() as db:
         # Load active custom rules
         rules_result = await db.execute(
             select(CustomRule).where(CustomRule.is_active.is_(True))
         )
-        custom_rules: List[CustomRule] = list(rules_result.scalars().all())
+        custom_rules = compile_custom_rules(list(rules_result.scalars().all()))
 
         try:
+            messages: List[Dict[str, Any]] = []
+            seen: set[str] = set()
+            # Graph messages are collected as each page arrives and ingested
+            # every _INSERT_BATCH_SIZE messages, so they don't pile up.  Once a
+            # poll passes _COPY_THRESHOLD messages (e.g. a first sync) the rest
+            # goes in with one COPY per _COPY_THRESHOLD messages.
             async with get_graph_client() as graph:
-                messages, new_delta = await graph.list_messages(
+                async for msg in graph.iter_messages(
                     mailbox=mailbox.address,
                     delta_link=mailbox.delta_link,
+                ):
+                    graph_id = msg.get("id")
+                    if not graph_id or graph_id in seen:
+                        continue
+                    seen.add(graph_id)
+                    messages.append(msg)
+                    use_copy = len(seen) > _COPY_THRESHOLD
+                    if len(messages) >= (
+                        _COPY_THRESHOLD if use_copy else _INSERT_BATCH_SIZE
+                    ):
+                        ingested += await _ingest_chunk(
+                            db, messages, mailbox.address, custom_rules,
+                            settings_row, now, use_copy=use_copy,
+                        )
+                        messages = []
+                new_delta = graph.next_delta_link
+
+            if messages:
+                ingested += await _ingest_chunk(
+                    db, messages, mailbox.address, custom_rules,
+                    settings_row, now,
+                    use_copy=len(messages) > _INSERT_BATCH_SIZE,
                 )
 
-            for msg in messages:
-                try:
-                    ingested += await _process_message(
-                        db=db,
-                        msg=msg,
-                        mailbox_address=mailbox.address,
-                        custom_rules=custom_rules,
-                        high_threshold=settings_row.high_malicious_threshold,
-                        low_threshold=settings_row.low_malicious_threshold,
-                    )
-                except Exception as exc:
-                    logger.error(
-                        "Failed to process message %s: %s",
-                        msg.get("id"),
-                        exc,
-                        exc_info=True,
-                    )
-
             # Update delta link and poll timestamp
             mailbox.delta_link = new_delta
-            mailbox.last_polled_at = datetime.now(timezone.utc)
+            mailbox.last_polled_at = now
             mailbox.last_error = None
             db.add(mailbox)
 
@@ -297,100 +403,308 @@ async def ingest_mailbox(mailbox: Mailbox, settings_row: AppSettings) -> int:
     return ingested
 
 
-async def _process_message(
+# (email row values, [(indicator_type, value), ...])
+_PendingEmail = Tuple[Dict[str, Any], List[Tuple[str, str]]]
+
+
+async def _ingest_chunk(
     db: AsyncSession,
+    messages: List[Dict[str, Any]],
+    mailbox_address: str,
+    custom_rules: CompiledRules,
+    settings_row: AppSettings,
+    now: datetime,
+    use_copy: bool,
+) -> int:
+    """
+    Ingest one chunk of Graph messages: skip those already stored, build and
+    classify the rest, then write them.  Returns the number inserted.
+    """
+    # Graph delta also returns changed messages that are already stored;
+    # drop them before paying for extraction and classification
+    stored = await _stored_message_ids(db, [m["id"] for m in messages])
+
+    pending: List[_PendingEmail] = []
+    for msg in messages:
+        if msg["id"] in stored:
+            continue
+        build_kwargs = dict(
+            msg=msg,
+            mailbox_address=mailbox_address,
+            custom_rules=custom_rules,
+            high_threshold=settings_row.high_malicious_threshold,
+            low_threshold=settings_row.low_malicious_threshold,
+            now=now,
+        )
+        try:
+            # Huge bodies go to a worker thread so their regex scans don't
+            # stall other coroutines; typical ones run inline.
+            body = msg.get("body") or {}
+            if len(body.get("content") or "") > _THREAD_BODY_CHARS:
+                built = await asyncio.to_thread(_build_email, **build_kwargs)
+            else:
+                built = _build_email(**build_kwargs)
+        except Exception as exc:
+            logger.error(
+                "Failed to process message %s: %s",
+                msg.get("id"),
+                exc,
+                exc_info=True,
+            )
+            continue
+        if built:
+            pending.append(built)
+
+    if not pending:
+        return 0
+    await _complete_verdicts(pending, settings_row)
+    if use_copy:
+        return await _copy_batch(db, pending)
+    return await _persist_batch(db, pending)
+
+
+async def _stored_message_ids(db: AsyncSession, graph_ids: List[str]) -> set[str]:
+    """Return which of `graph_ids` are already ingested."""
+    # One array parameter (= ANY) rather than an IN list with a bind per id:
+    # a COPY-sized chunk would blow past asyncpg's 32767-parameter limit
+    result = await db.execute(
+        select(Email.graph_message_id).where(
+            Email.graph_message_id == any_(cast(graph_ids, ARRAY(String)))
+        )
+    )
+    return set(result.scalars().all())
+
+
+def _build_email(
     msg: Dict[str, Any],
     mailbox_address: str,
-    custom_rules: List[CustomRule],
+    custom_rules: CompiledRules,
     high_threshold: float,
     low_threshold: float,
-) -> int:
+    now: datetime,
+) -> Optional[_PendingEmail]:
     """
-    Process a single Graph message dict.  Returns 1 if persisted, 0 if duplicate.
+    Classify a single Graph message dict and build its insert values.
+    `now` is the poll's timestamp, used if the message has no usable
+    receivedDateTime.  Returns None if the message has no Graph id.
     """
     graph_id: str = msg.get("id", "")
     if not graph_id:
-        return 0
-
-    # De-duplicate
-    existing = await db.execute(
-        select(Email.id).where(Email.graph_message_id == graph_id)
-    )
-    if existing.scalar_one_or_none():
-        return 0  # already ingested
+        return None
 
     from app.services.graph_api import GraphAPIClient  # local import to avoid cycle
 
     sender, sender_domain = GraphAPIClient.extract_sender(msg)
     recipient = GraphAPIClient.extract_recipient(msg)
-    received_at = GraphAPIClient.extract_received_at(msg)
+    received_at = GraphAPIClient.extract_received_at(msg, default=now)
     body_html, body_text = GraphAPIClient.extract_body(msg)
     subject: str = msg.get("subject", "(no subject)")
 
     # Extract threat indicators
     urls, domains, ips = extract_indicators(body_html, body_text)
 
-    # Classify
-    ai_category, confidence, reasoning = _classifier.classify(
-        subject=subject,
-        body_text=body_text or "",
-        sender_domain=sender_domain,
-        urls=urls,
-        ips=ips,
-        high_threshold=high_threshold,
-        low_threshold=low_threshold,
-    )
+    # Lowercased once, shared by the classifier and the custom rules
+    haystack_lower = (subject + " " + (body_text or "")).lower()
 
-    # Apply custom rules (may override AI)
+    # Custom rules first: a forced category makes the classifier's verdict
+    # moot, so skip its keyword/TLD/typo scans entirely
     forced = apply_custom_rules(
-        subject=subject,
-        body_text=body_text or "",
-        sender_domain=sender_domain,
+        haystack_lower=haystack_lower,
+        domain_lower=sender_domain.lower(),
         rules=custom_rules,
     )
     if forced:
-        ai_category = forced
-        reasoning.insert(0, f"Force-classified by custom rule → {forced}")
-
-    # Build and persist Email
-    email = Email(
-        graph_message_id=graph_id,
-        mailbox_address=mailbox_address,
-        sender=sender,
-        sender_domain=sender_domain,
-        recipient=recipient,
-        subject=subject,
-        received_at=received_at,
-        body_html=body_html,
-        body_text=body_text,
-        ai_category=ai_category,
-        confidence_score=confidence,
-        ai_reasoning=reasoning,
-        review_status="pending",
-    )
-    db.add(email)
-    await db.flush()  # get email.id without committing
-
-    # Threat indicators
-    for url in urls:
-        db.add(ThreatIndicator(email_id=email.id, indicator_type="url", value=url))
-    for domain in domains:
-        db.add(ThreatIndicator(email_id=email.id, indicator_type="domain", value=domain))
-    for ip in ips:
-        db.add(ThreatIndicator(email_id=email.id, indicator_type="ip", value=ip))
-
-    # Initial audit trail entry
-    db.add(
-        AuditTrailEntry(
-            email_id=email.id,
-            timestamp=datetime.now(timezone.utc),
-            action="ingested",
-            actor="system",
-            detail=f"AI classified as {ai_category} (confidence: {confidence:.2%})",
+        ai_category, confidence = forced, 1.0
+        reasoning = [f"Force-classified by custom rule → {forced}"]
+    elif _BATCH_CLASSIFY:
+        # Filled in per batch by _complete_verdicts before the row is written
+        ai_category, confidence, reasoning = None, None, []
+    else:
+        ai_category, confidence, reasoning = _classifier.classify(
+            subject=subject,
+            body_text=body_text or "",
+            sender_domain=sender_domain,
+            urls=urls,
+            ips=ips,
+            high_threshold=high_threshold,
+            low_threshold=low_threshold,
+            text_lower=haystack_lower,
         )
+
+    row = {
+        "graph_message_id": graph_id,
+        "mailbox_address": mailbox_address,
+        "sender": sender,
+        "sender_domain": sender_domain,
+        "recipient": recipient,
+        "subject": subject,
+        "received_at": received_at,
+        "body_html": body_html,
+        "body_text": body_text,
+        "ai_category": ai_category,
+        "confidence_score": confidence,
+        "ai_reasoning": reasoning,
+        "review_status": "pending",
+    }
+    indicators = (
+        [("url", url) for url in urls]
+        + [("domain", domain) for domain in domains]
+        + [("ip", ip) for ip in ips]
+    )
+    return row, indicators
+
+
+async def _complete_verdicts(
+    batch: List[_PendingEmail], settings_row: AppSettings
+) -> None:
+    """
+    Classify the rows _build_email left unclassified (OpenAI classifier
+    active) with one classify_batch_async call, updating them in place.
+    """
+    todo = [(row, indicators) for row, indicators in batch if row["ai_category"] is None]
+    if not todo:
+        return
+    verdicts = await _classifier.classify_batch_async(
+        [
+            EmailInput(
+                subject=row["subject"],
+                body_text=row["body_text"] or "",
+                sender_domain=row["sender_domain"],
+                urls=[value for kind, value in indicators if kind == "url"],
+                ips=[value for kind, value in indicators if kind == "ip"],
+            )
+            for row, indicators in todo
+        ],
+        high_threshold=settings_row.high_malicious_threshold,
+        low_threshold=settings_row.low_malicious_threshold,
     )
+    for (row, _), (category, confidence, reasoning) in zip(todo, verdicts):
+        row["ai_category"] = category
+        row["confidence_score"] = confidence
+        row["ai_reasoning"] = reasoning
+
+
+async def _persist_batch(db: AsyncSession, batch: List[_PendingEmail]) -> int:
+    """
+    Insert a batch of emails plus their threat indicators, keyword hits and
+    initial audit trail entries — one INSERT per table.  Messages already
+    ingested are skipped via ON CONFLICT on graph_message_id.  Returns the
+    number inserted.
+    """
+    result = await db.execute(
+        pg_insert(Email)
+        .values([row for row, _ in batch])
+        .on_conflict_do_nothing(index_elements=["graph_message_id"])
+        .returning(Email.id, Email.graph_message_id)
+    )
+    inserted: Dict[str, uuid.UUID] = {gid: eid for eid, gid in result.all()}
+    if not inserted:
+        return 0
 
-    return 1
+    indicator_rows: List[Dict[str, Any]] = []
+    keyword_rows: List[Dict[str, Any]] = []
+    trail_rows: List[Dict[str, Any]] = []
+    for row, indicators in batch:
+        email_id = inserted.get(row["graph_message_id"])
+        if email_id is None:
+            continue  # already ingested
+        indicator_rows.extend(
+            {"email_id": email_id, "indicator_type": kind, "value": value}
+            for kind, value in indicators
+        )
+        keyword_rows.extend(
+            {
+                "email_id": email_id,
+                "keyword": keyword,
+                "hit_count": count,
+                "ai_category": row["ai_category"],
+            }
+            for keyword, count in match_phishing_keywords(row["ai_reasoning"])
+        )
+        trail_rows.append(
+            {
+                "email_id": email_id,
+                "action": "ingested",
+                "actor": "system",
+                "detail": (
+                    f"AI classified as {row['ai_category']} "
+                    f"(confidence: {row['confidence_score']:.2%})"
+                ),
+            }
+        )
+
+    if indicator_rows:
+        await db.execute(insert(ThreatIndicator), indicator_rows)
+    if keyword_rows:
+        await db.execute(insert(KeywordHit), keyword_rows)
+    await db.execute(insert(AuditTrailEntry), trail_rows)
+
+    return len(inserted)
+
+
+_EMAIL_COPY_COLUMNS = (
+    "id", "graph_message_id", "mailbox_address", "sender", "sender_domain",
+    "recipient", "subject", "received_at", "body_html", "body_text",
+    "ai_category", "confidence_score", "ai_reasoning", "review_status",
+)
+
+
+async def _copy_batch(db: AsyncSession, batch: List[_PendingEmail]) -> int:
+    """
+    COPY a large batch of emails plus indicators, keyword hits and audit trail
+    entries.  COPY has no ON CONFLICT, so the batch must already be filtered
+    against stored messages (see _stored_message_ids); email ids are generated
+    client-side for the child rows.
+    """
+    email_records: List[tuple] = []
+    indicator_records: List[tuple] = []
+    keyword_records: List[tuple] = []
+    trail_records: List[tuple] = []
+    for row, indicators in batch:
+        email_id = uuid.uuid4()
+        email_records.append(
+            (email_id,) + tuple(row[col] for col in _EMAIL_COPY_COLUMNS[1:])
+        )
+        indicator_records.extend(
+            (email_id, kind, value, False) for kind, value in indicators
+        )
+        keyword_records.extend(
+            (email_id, keyword, count, row["ai_category"])
+            for keyword, count in match_phishing_keywords(row["ai_reasoning"])
+        )
+        trail_records.append(
+            (
+                email_id,
+                "ingested",
+                "system",
+                f"AI classified as {row['ai_category']} "
+                f"(confidence: {row['confidence_score']:.2%})",
+            )
+        )
+
+    if not email_records:
+        return 0
+
+    await bulk_copy(db, Email.__tablename__, _EMAIL_COPY_COLUMNS, email_records)
+    await bulk_copy(
+        db,
+        ThreatIndicator.__tablename__,
+        ("email_id", "indicator_type", "value", "is_malicious"),
+        indicator_records,
+    )
+    await bulk_copy(
+        db,
+        KeywordHit.__tablename__,
+        ("email_id", "keyword", "hit_count", "ai_category"),
+        keyword_records,
+    )
+    await bulk_copy(
+        db,
+        AuditTrailEntry.__tablename__,
+        ("email_id", "action", "actor", "detail"),
+        trail_records,
+    )
+    return len(email_records)
 
 
 # ── Ingestion runner (called by scheduler) ────────────────────────────────────
@@ -409,61 +723,55 @@ async def run_ingestion() -> Dict[str, Any]:
         "errors": [],
     }
 
+    # One session for the whole run. It only holds a pooled connection while
+    # a transaction is open, so it is idle while the mailboxes are processed,
+    # and settings_row stays loaded for the final status update.
     async with AsyncSessionLocal() as db:
         # Set job status to "running"
         settings_result = await db.execute(select(AppSettings))
         settings_row: Optional[AppSettings] = settings_result.scalar_one_or_none()
-        if settings_row:
-            settings_row.job_status = "running"
-            db.add(settings_row)
-            await db.commit()
-
-    if not settings_row:
-        logger.warning("AppSettings row not found — skipping ingestion")
-        return summary
+        if not settings_row:
+            logger.warning("AppSettings row not found — skipping ingestion")
+            return summary
+        settings_row.job_status = "running"
 
-    # Load active mailboxes
-    async with AsyncSessionLocal() as db:
+        # Load active mailboxes
         mb_result = await db.execute(
             select(Mailbox).where(Mailbox.is_active.is_(True))
         )
         mailboxes: List[Mailbox] = list(mb_result.scalars().all())
+        await db.commit()
 
-    settings_cfg = get_settings()
-    if not settings_cfg.graph_api_configured:
-        logger.warning(
-            "Graph API credentials not configured — ingestion skipped. "
-            "Set AZURE_TENANT_ID, AZURE_CLIENT_ID, AZURE_CLIENT_SECRET in .env"
-        )
-        async with AsyncSessionLocal() as db:
-            s = await db.get(AppSettings, settings_row.id)
-            if s:
-                s.job_status = "idle"
-                await db.commit()
-        return summary
-
-    for mailbox in mailboxes:
-        try:
-            count = await ingest_mailbox(mailbox, settings_row)
-            summary["total_ingested"] += count
-            summary["mailboxes_processed"] += 1
-        except Exception as exc:
-            err = f"{mailbox.address}: {exc}"
-            logger.error(err, exc_info=True)
-            summary["errors"].append(err)
-
-    # Update job status back to idle
-    async with AsyncSessionLocal() as db:
-        s = await db.get(AppSettings, settings_row.id)
-        if s:
-            s.job_status = "idle"
-            s.job_last_run = datetime.now(timezone.utc)
-            if summary["errors"]:
-                s.job_error_message = "; ".join(summary["errors"])[:512]
-            else:
-                s.job_error_message = None
-            db.add(s)
+        settings_cfg = get_settings()
+        if not settings_cfg.graph_api_configured:
+            logger.warning(
+                "Graph API credentials not configured — ingestion skipped. "
+                "Set AZURE_TENANT_ID, AZURE_CLIENT_ID, AZURE_CLIENT_SECRET in .env"
+            )
+            settings_row.job_status = "idle"
             await db.commit()
+            return summary
+
+        for mailbox in mailboxes:
+            # ingest_mailbox saves the mailbox through its own session
+            db.expunge(mailbox)
+            try:
+                count = await ingest_mailbox(mailbox, settings_row)
+                summary["total_ingested"] += count
+                summary["mailboxes_processed"] += 1
+            except Exception as exc:
+                err = f"{mailbox.address}: {exc}"
+                logger.error(err, exc_info=True)
+                summary["errors"].append(err)
+
+        # Update job status back to idle
+        settings_row.job_status = "idle"
+        settings_row.job_last_run = datetime.now(timezone.utc)
+        if summary["errors"]:
+            settings_row.job_error_message = "; ".join(summary["errors"])[:512]
+        else:
+            settings_row.job_error_message = None
+        await db.commit()
 
     logger.info(
         "Ingestion complete: %d emails from %d mailboxes",
@@ -17,10 +17,7 @@ HOW TO ACTIVATE
         AZURE_OPENAI_API_VERSION=2024-02-01
 
 3.  In backend/app/services/ingestion.py, replace the classifier
-    instantiation block (look for "CLASSIFIER SELECTION") with:
-
-        from app.services.openai_classifier import OpenAIClassifier
-        from app.services.openai_classifier import SimpleClassifier  # fallback
+    instantiation line (look for "CLASSIFIER SELECTION") with:
 
         _settings = get_settings()
         if _settings.openai_configured:
@@ -28,15 +25,21 @@ HOW TO ACTIVATE
         else:
             _classifier = SimpleClassifier()
 
-    Both classes expose the same async-compatible interface, so the rest
-    of ingestion.py requires no other changes.
+    ingest_mailbox detects the OpenAI classifier and classifies each batch
+    of new messages with classify_batch_async() (BATCH_SIZE emails per chat
+    completion) right before writing it, so nothing else in ingestion.py
+    needs to change.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.services.ingestion import SimpleClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +75,50 @@ URLS FOUND ({url_count}):
 {url_sample}
 """
 
+# Batch variant: several emails per request (see classify_batch_async)
+_BATCH_SYSTEM_PROMPT = """\
+You are a cybersecurity expert specializing in email phishing detection.
+You will receive a JSON object {"emails": [...]}; each email has an "id",
+"sender_domain", "subject", "body" (truncated) and "urls".
+Classify EVERY email into one of three categories:
+
+  • high_malicious  — clear phishing or malware delivery attempt
+  • low_malicious   — suspicious, possibly spam or social engineering
+  • safe            — legitimate email
+
+Respond with valid JSON only. No prose, no markdown, no code fences.
+Schema:
+{
+  "results": [
+    {
+      "id": <the email's id>,
+      "category": "high_malicious" | "low_malicious" | "safe",
+      "confidence": <float 0.0–1.0>,
+      "reasoning": [<string>, ...]   // 1-5 concise bullet points
+    },
+    ...
+  ]
+}
+"""
+
+# Emails per batched chat completion.  Each answer is budgeted 512 output
+# tokens, and gpt-4o deployments cap a completion's output at 4096.
+BATCH_SIZE = 8
+_MAX_OUTPUT_TOKENS = 4096
+
+# Batched chat completions in flight at once per classify_batch_async call
+_MAX_CONCURRENT_BATCHES = 8
+
+
+class EmailInput(NamedTuple):
+    """One email's classifier inputs for classify_batch_async()."""
+
+    subject: str
+    body_text: str
+    sender_domain: str
+    urls: List[str]
+    ips: List[str]
+
 
 # ---------------------------------------------------------------------------
 # OpenAI classifier
@@ -93,6 +140,10 @@ class OpenAIClassifier:
     for activation instructions.
     """
 
+    # One AsyncAzureOpenAI client (and so one pooled httpx client) per process,
+    # shared by every instance so TLS connections are kept alive across calls.
+    _client: Optional[Any] = None
+
     def __init__(self) -> None:
         # Import deferred so the app starts fine without the openai package
         # if the classifier is never instantiated.
@@ -114,12 +165,27 @@ class OpenAIClassifier:
                 "AZURE_OPENAI_DEPLOYMENT in backend/.env"
             )
 
-        self._client = AsyncAzureOpenAI(
-            azure_endpoint=cfg.azure_openai_endpoint,
-            api_key=cfg.azure_openai_api_key,
-            api_version=cfg.azure_openai_api_version,
-        )
+        if OpenAIClassifier._client is None:
+            import httpx
+
+            OpenAIClassifier._client = AsyncAzureOpenAI(
+                azure_endpoint=cfg.azure_openai_endpoint,
+                api_key=cfg.azure_openai_api_key,
+                api_version=cfg.azure_openai_api_version,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=100, max_keepalive_connections=20
+                    ),
+                ),
+            )
         self._deployment = cfg.azure_openai_deployment
+
+        # Heuristic fallback for failed API calls, resolved once here rather
+        # than in the except path.  Deferred import: ingestion.py may import
+        # this module at load time.
+        from app.services.ingestion import SimpleClassifier
+
+        self._fallback: SimpleClassifier = SimpleClassifier()
         logger.info(
             "OpenAIClassifier initialised (deployment: %s)", self._deployment
         )
@@ -162,17 +228,14 @@ class OpenAIClassifier:
         """
         Synchronous wrapper — raises RuntimeError because this classifier is async.
 
-        ingestion.py calls classify() synchronously; if you switch to
-        OpenAIClassifier you should also make _process_message() await an
-        async classify() method. The async version is classify_async() below.
-
-        For a quick drop-in, wrap calls with asyncio.run() or use classify_async()
-        inside an async context.
+        ingestion.py never calls it for this classifier: it batches emails
+        through classify_batch_async() instead.  For a single email use
+        classify_async() inside an async context.
         """
         raise RuntimeError(
             "OpenAIClassifier.classify() is async. "
-            "Call await classifier.classify_async(...) instead and update "
-            "_process_message() in ingestion.py accordingly."
+            "Call await classifier.classify_async(...) or "
+            "classifier.classify_batch_async(...) instead."
         )
 
     async def classify_async(
@@ -196,30 +259,11 @@ class OpenAIClassifier:
         """
         try:
             result = await self._call_api(subject, body_text, sender_domain, urls)
-
-            category: str = result.get("category", "safe")
-            confidence: float = float(result.get("confidence", 0.5))
-            reasoning: List[str] = result.get("reasoning", [])
-
-            # Validate category value
-            if category not in ("high_malicious", "low_malicious", "safe"):
-                logger.warning(
-                    "OpenAI returned unexpected category '%s', defaulting to 'safe'",
-                    category,
-                )
-                category = "safe"
-
-            # Clamp confidence
-            confidence = max(0.0, min(0.99, confidence))
-
-            # Ensure reasoning is a list of strings
-            if not isinstance(reasoning, list):
-                reasoning = [str(reasoning)]
-
+            category, confidence, reasoning = _normalize_result(result)
             logger.debug(
                 "OpenAI classified '%s' as %s (%.2f)", subject, category, confidence
             )
-            return category, round(confidence, 4), reasoning
+            return category, confidence, reasoning
 
         except Exception as exc:
             logger.error(
@@ -229,9 +273,7 @@ class OpenAIClassifier:
                 exc_info=True,
             )
             # Graceful fallback to simple heuristic classifier
-            from app.services.ingestion import SimpleClassifier
-            fallback = SimpleClassifier()
-            return fallback.classify(
+            return self._fallback.classify(
                 subject=subject,
                 body_text=body_text,
                 sender_domain=sender_domain,
@@ -240,3 +282,125 @@ class OpenAIClassifier:
                 high_threshold=high_threshold,
                 low_threshold=low_threshold,
             )
+
+
+    # ── Batched classification ─────────────────────────────────────────────
+
+    async def classify_batch_async(
+        self,
+        emails: List[EmailInput],
+        high_threshold: float,
+        low_threshold: float,
+    ) -> List[Tuple[str, float, List[str]]]:
+        """
+        Classify many emails with one chat completion per BATCH_SIZE emails
+        (up to _MAX_CONCURRENT_BATCHES chunks in flight).  Returns one
+        (category, confidence, reasoning) per input, in input order.
+
+        Emails the model leaves out of its answer — or a whole chunk whose
+        request fails — fall back to the heuristic classifier.
+        """
+        chunks = [emails[i:i + BATCH_SIZE] for i in range(0, len(emails), BATCH_SIZE)]
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_BATCHES)
+
+        async def run(chunk: List[EmailInput]) -> List[Tuple[str, float, List[str]]]:
+            async with limit:
+                return await self._classify_chunk(chunk, high_threshold, low_threshold)
+
+        results = await asyncio.gather(*(run(c) for c in chunks))
+        return [r for chunk_results in results for r in chunk_results]
+
+    async def _classify_chunk(
+        self,
+        emails: List[EmailInput],
+        high_threshold: float,
+        low_threshold: float,
+    ) -> List[Tuple[str, float, List[str]]]:
+        by_id: Dict[int, dict] = {}
+        try:
+            payload = {
+                "emails": [
+                    {
+                        "id": i,
+                        "sender_domain": e.sender_domain,
+                        "subject": e.subject,
+                        "body": (e.body_text or "")[:2000],
+                        "urls": e.urls[:10],
+                    }
+                    for i, e in enumerate(emails)
+                ]
+            }
+            response = await self._client.chat.completions.create(
+                model=self._deployment,
+                messages=[
+                    {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": json.dumps(payload)},
+                ],
+                temperature=0.0,
+                max_tokens=min(512 * len(emails), _MAX_OUTPUT_TOKENS),
+                response_format={"type": "json_object"},
+            )
+            raw = json.loads(response.choices[0].message.content or "{}")
+            for item in raw.get("results", []):
+                if isinstance(item, dict) and isinstance(item.get("id"), int):
+                    by_id[item["id"]] = item
+        except Exception as exc:
+            logger.error(
+                "OpenAI batch classification failed for %d email(s): %s — "
+                "falling back to heuristics",
+                len(emails),
+                exc,
+                exc_info=True,
+            )
+
+        results: List[Tuple[str, float, List[str]]] = []
+        for i, e in enumerate(emails):
+            item = by_id.get(i)
+            if item is not None:
+                try:
+                    results.append(_normalize_result(item))
+                    continue
+                except Exception as exc:
+                    # e.g. a null or non-numeric confidence for this one email
+                    logger.warning(
+                        "OpenAI returned a malformed result for '%s': %s — "
+                        "falling back to heuristics",
+                        e.subject,
+                        exc,
+                    )
+            results.append(
+                self._fallback.classify(
+                    subject=e.subject,
+                    body_text=e.body_text,
+                    sender_domain=e.sender_domain,
+                    urls=e.urls,
+                    ips=e.ips,
+                    high_threshold=high_threshold,
+                    low_threshold=low_threshold,
+                )
+            )
+        return results
+
+
+def _normalize_result(result: dict) -> Tuple[str, float, List[str]]:
+    """Validate one model answer into (category, confidence, reasoning)."""
+    category: str = result.get("category", "safe")
+    confidence: float = float(result.get("confidence", 0.5))
+    reasoning: List[str] = result.get("reasoning", [])
+
+    # Validate category value
+    if category not in ("high_malicious", "low_malicious", "safe"):
+        logger.warning(
+            "OpenAI returned unexpected category '%s', defaulting to 'safe'",
+            category,
+        )
+        category = "safe"
+
+    # Clamp confidence
+    confidence = max(0.0, min(0.99, confidence))
+
+    # Ensure reasoning is a list of strings
+    if not isinstance(reasoning, list):
+        reasoning = [str(reasoning)]
+
+    return category, round(confidence, 4), reasoning
@@ -34,20 +34,12 @@ export default function EmailDetail() {
     },
   });
 
-  const { data: similarEmails } = useQuery({
-    queryKey: ["similar-emails", email?.similarEmailIds],
-    queryFn: async () => {
-      if (!email?.similarEmailIds?.length) return [];
-      const results = await Promise.all(email.similarEmailIds.map(id => api.emails.getById(id)));
-      return results.filter(Boolean);
-    },
-    enabled: !!email?.similarEmailIds?.length,
-  });
-
   if (isLoading) return <div className="flex items-center justify-center h-64"><div className="text-muted-foreground">Loading...</div></div>;
   if (!email) return <div className="text-center py-20 text-muted-foreground">Email not found</div>;
 
   const confidencePercent = Math.round(email.confidenceScore * 100);
+  // Hydrated by the detail endpoint in one query — no per-id fetches
+  const similarEmails = email.similar_emails ?? [];
 
   return (
     <div className="space-y-6 max-w-6xl">
@@ -202,17 +194,17 @@ export default function EmailDetail() {
           </Card>
 
           {/* Similar Emails */}
-          {similarEmails && similarEmails.length > 0 && (
+          {similarEmails.length > 0 && (
             <Card className="bg-card border-border">
               <CardHeader className="pb-2"><CardTitle className="text-xs text-muted-foreground uppercase tracking-wider">Similar Emails</CardTitle></CardHeader>
               <CardContent className="space-y-2">
-                {similarEmails.map((se) => se && (
-                  <Link key={se.emailId} to={`/emails/${se.emailId}`} className="flex items-center justify-between p-2 rounded hover:bg-secondary/50 transition-colors group">
+                {similarEmails.map((se) => (
+                  <Link key={se.id} to={`/emails/${se.id}`} className="flex items-center justify-between p-2 rounded hover:bg-secondary/50 transition-colors group">
                     <div className="min-w-0">
                       <p className="text-xs font-medium truncate group-hover:text-primary">{se.subject}</p>
                       <p className="text-[10px] text-muted-foreground">{se.sender}</p>
                     </div>
-                    <ThreatBadge category={se.aiCategory} className="ml-2 shrink-0" />
+                    <ThreatBadge category={se.ai_category} className="ml-2 shrink-0" />
                   </Link>
                 ))}
               </CardContent>
@@ -71,6 +71,7 @@ export interface EmailDetail extends Email {
   reviewed_by?: string;
   reviewed_at?: string;
   similar_email_ids?: string[];
+  similar_emails?: Email[];
   threat_indicators: ThreatIndicator[];
   audit_trail: AuditTrailEntry[];
   created_at: string;